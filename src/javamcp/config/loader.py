@@ -42,7 +42,7 @@ Configuration file loader supporting YAML and JSON formats.
 import json
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from pydantic import ValidationError
 
@@ -54,8 +54,12 @@ logger = logging.getLogger("javamcp.config")
 try:
     import yaml
 
+    # Prefer the libyaml-backed safe loader; PyYAML builds without libyaml
+    # only ship the pure-Python one
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     YAML_AVAILABLE = True
 except ImportError:
+    _YamlLoader = None
     YAML_AVAILABLE = False
 
 
@@ -101,20 +105,17 @@ def load_config(config_path: Optional[str] = None) -> ApplicationConfig:
     suffix = path.suffix.lower()
     logger.debug("Detected configuration format: %s", suffix)
 
-    if suffix in (".yaml", ".yml"):
-        config = _load_yaml_config(content, config_path)
-        logger.info("Configuration loaded successfully from %s", config_path)
-        return config
-    if suffix == ".json":
-        config = _load_json_config(content, config_path)
-        logger.info("Configuration loaded successfully from %s", config_path)
-        return config
+    loader = _CONFIG_LOADERS.get(suffix)
+    if loader is None:
+        logger.error("Unsupported configuration format: %s", suffix)
+        raise ConfigurationError(
+            f"Unsupported configuration file format: {suffix}. "
+            "Supported formats: .yaml, .yml, .json"
+        )
 
-    logger.error("Unsupported configuration format: %s", suffix)
-    raise ConfigurationError(
-        f"Unsupported configuration file format: {suffix}. "
-        "Supported formats: .yaml, .yml, .json"
-    )
+    config = loader(content, config_path)
+    logger.info("Configuration loaded successfully from %s", config_path)
+    return config
 
 
 def _load_yaml_config(content: str, config_path: str) -> ApplicationConfig:
@@ -127,7 +128,7 @@ def _load_yaml_config(content: str, config_path: str) -> ApplicationConfig:
 
     try:
         logger.debug("Parsing YAML configuration")
-        data = yaml.safe_load(content)
+        data = yaml.load(content, Loader=_YamlLoader)
     except yaml.YAMLError as e:
         logger.error("Failed to parse YAML configuration: %s", e)
         raise ConfigurationError(
@@ -154,6 +155,14 @@ def _load_json_config(content: str, config_path: str) -> ApplicationConfig:
     return _validate_config(data, config_path)
 
 
+# Configuration parser for each supported file suffix
+_CONFIG_LOADERS: dict[str, Callable[[str, str], ApplicationConfig]] = {
+    ".yaml": _load_yaml_config,
+    ".yml": _load_yaml_config,
+    ".json": _load_json_config,
+}
+
+
 def _validate_config(data: dict, config_path: str) -> ApplicationConfig:
     """Validate configuration data using Pydantic."""
     logger.debug("Validating configuration")
@@ -39,11 +39,15 @@
 Context building and formatting for Java APIs.
 """
 
-from .context_builder import ContextBuilder
+from .context_builder import ContextBuilder, get_context_builder
 from .formatter import format_class_context, format_method_context
+from .guide_builder import extract_keywords, format_guide
 
 __all__ = [
     "ContextBuilder",
+    "get_context_builder",
     "format_class_context",
     "format_method_context",
+    "extract_keywords",
+    "format_guide",
 ]
@@ -240,3 +240,22 @@ class ContextBuilder:
         if method.javadoc and param_name in method.javadoc.params:
             return method.javadoc.params[param_name]
         return ""
+
+
+# Shared builder instance (initialized lazily)
+_shared_builder: Optional[ContextBuilder] = None
+
+
+def get_context_builder() -> ContextBuilder:
+    """
+    Get or create the process-wide ContextBuilder instance.
+
+    Returns:
+        Shared ContextBuilder instance
+    """
+    global _shared_builder  # pylint: disable=global-statement
+
+    if _shared_builder is None:
+        _shared_builder = ContextBuilder()
+
+    return _shared_builder
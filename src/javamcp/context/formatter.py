@@ -195,7 +195,7 @@ def format_method_signature(method: JavaMethod) -> str:
     Returns:
         Formatted signature string
     """
-    params = ", ".join(f"{p.type} {p.name}" for p in method.parameters)
+    params = ", ".join([p.type + " " + p.name for p in method.parameters])
     return f"{method.return_type} {method.name}({params})"
 
 
@@ -0,0 +1,112 @@
+# General Disclaimer
+#
+# **AI Generated Content**
+#
+# This project's source code and documentation were generated predominantly
+# by an Artificial Intelligence Large Language Model (AI LLM). The project
+# lead, [Rubens Gomes](https://rubensgomes.com), provided initial prompts,
+# reviewed, and made refinements to the generated output. While human review and
+# refinement have occurred, users should be aware that the output may contain
+# inaccuracies, errors, or security vulnerabilities
+#
+# **Third-Party Content Notice**
+#
+# This software may include components or snippets derived from third-party
+# sources. The software's users and distributors are responsible for ensuring
+# compliance with any underlying licenses applicable to such components.
+#
+# **Copyright Status Statement**
+#
+# Copyright protection, if any, is limited to the original human contributions and
+# modifications made to this project. The AI-generated portions of the code and
+# documentation are not subject to copyright and are considered to be in the
+# public domain.
+#
+# **Limitation of liability**
+#
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES, OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT, OR
+# OTHERWISE, ARISING FROM, OUT OF, OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# **No-Warranty Disclaimer**
+#
+# THIS SOFTWARE IS PROVIDED 'AS IS,' WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE, AND NONINFRINGEMENT.
+
+"""
+Keyword search and markdown rendering shared by the generate_guide tools.
+"""
+
+import re
+from functools import lru_cache
+
+from javamcp.models.java_entities import JavaClass, JavaMethod
+
+from .context_builder import ContextBuilder
+
+# Maximum number of class summaries rendered in a guide
+MAX_GUIDE_CLASS_SUMMARIES = 5
+
+# Words ignored when extracting keywords from a use case description
+_STOPWORDS = frozenset(
+    {"how", "to", "the", "a", "an", "is", "are", "for", "in", "on", "with"}
+)
+
+# Runs of Java identifier characters at least three long; anything else,
+# such as "-", "." or "<", separates words
+_TOKEN_RE = re.compile(r"[\w$]{3,}")
+
+# Static trailer of a generated guide when relevant methods were found
+_GUIDE_METHODS_SECTION = (
+    "## Relevant Methods\n\nFound relevant methods for the use case.\n"
+)
+
+
+@lru_cache(maxsize=1024)
+def extract_keywords(use_case: str) -> tuple[str, ...]:
+    """
+    Extract search keywords from a use case description.
+
+    Args:
+        use_case: Free-form use case description
+
+    Returns:
+        Lowercased keywords, without stopwords and words of two characters
+        or fewer
+    """
+    return tuple(w for w in _TOKEN_RE.findall(use_case.lower()) if w not in _STOPWORDS)
+
+
+def format_guide(
+    use_case: str,
+    relevant_classes: list[JavaClass],
+    relevant_methods: list[JavaMethod],
+    context_builder: ContextBuilder,
+) -> str:
+    """
+    Render the markdown usage guide for a use case.
+
+    Args:
+        use_case: Use case the guide was generated for
+        relevant_classes: Classes found for the use case
+        relevant_methods: Methods found for the use case
+        context_builder: ContextBuilder used for class summaries
+
+    Returns:
+        Markdown guide
+    """
+    sections = [f"# API Usage Guide: {use_case}\n"]
+
+    if relevant_classes:
+        summaries = "\n\n".join(
+            context_builder.build_api_summary(java_class)
+            for java_class in relevant_classes[:MAX_GUIDE_CLASS_SUMMARIES]
+        )
+        sections.append(f"## Relevant Classes\n\n{summaries}\n")
+
+    if relevant_methods:
+        sections.append(_GUIDE_METHODS_SECTION)
+
+    return "\n".join(sections)
@@ -40,7 +40,8 @@ API indexer for organizing parsed Java classes and methods.
 """
 
 from collections import defaultdict
-from typing import Optional
+from operator import itemgetter
+from typing import Any, Callable, Optional, Sequence
 
 from javamcp.logging import get_logger
 from javamcp.models.java_entities import JavaClass, JavaMethod
@@ -48,8 +49,22 @@ from javamcp.models.java_entities import JavaClass, JavaMethod
 # Module-level logger
 logger = get_logger("indexer")
 
+# Longest n-gram used for partial method name lookups
+NGRAM_SIZE = 3
 
-class APIIndexer:
+
+def _ngrams(text: str, max_size: int = NGRAM_SIZE) -> set[str]:
+    """Return the set of overlapping substrings of text up to max_size long."""
+    return {
+        text[i : i + size]
+        for size in range(1, max_size + 1)
+        for i in range(len(text) - size + 1)
+    }
+
+
+# Each lookup structure is a separate attribute so the hot query paths read
+# it directly, without going through a holder object
+class APIIndexer:  # pylint: disable=too-many-instance-attributes
     """
     Indexes Java classes and methods for fast lookup and searching.
     """
@@ -76,8 +91,46 @@ class APIIndexer:
         # Index by class name -> list of methods
         self.class_method_index: dict[str, list[JavaMethod]] = defaultdict(list)
 
+        # Index by fully-qualified name -> repository URL
+        self.class_repository_index: dict[str, str] = {}
+
+        # Index by lowercased simple class name -> simple class names
+        self.class_name_lower_index: dict[str, list[str]] = defaultdict(list)
+
+        # Index by lowercased fully-qualified name -> fully-qualified names
+        self.class_fqn_lower_index: dict[str, list[str]] = defaultdict(list)
+
+        # Index by lowercased method name -> method names
+        self.method_name_lower_index: dict[str, list[str]] = defaultdict(list)
+
+        # Method name -> lowercased method name, computed once per name
+        self.method_name_lower: dict[str, str] = {}
+
+        # Index by n-gram (1 to NGRAM_SIZE characters) of lowercased method
+        # name -> method names containing it (dict used as an ordered set)
+        self.method_ngram_index: dict[str, dict[str, None]] = defaultdict(dict)
+
+        # Number of entries across class_method_index, kept in step with it
+        self._method_count = 0
+
         self._is_built = False
 
+        # Bumped on every index mutation so callers can invalidate derived data
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        Get the index generation counter.
+
+        The counter changes whenever classes are added or removed, so a value
+        computed from the index stays valid while the generation is unchanged.
+
+        Returns:
+            Current generation number
+        """
+        return self._generation
+
     def add_class(self, java_class: JavaClass, repository_url: str) -> None:
         """
         Add a Java class to the index.
@@ -86,27 +139,7 @@ class APIIndexer:
             java_class: JavaClass to index
             repository_url: Repository URL this class belongs to
         """
-        # Index by fully-qualified name
-        self.class_index[java_class.fully_qualified_name] = java_class
-
-        # Index by simple class name
-        self.class_name_index[java_class.name].append(java_class)
-
-        # Index by package
-        self.package_index[java_class.package].append(java_class)
-
-        # Index by repository
-        self.repository_index[repository_url].append(java_class)
-
-        # Index methods
-        for method in java_class.methods:
-            # Index by method name
-            self.method_index[method.name].append((java_class, method))
-
-            # Index by class name -> methods
-            self.class_method_index[java_class.fully_qualified_name].append(method)
-
-        self._is_built = True
+        self._index_classes((java_class,), repository_url)
 
     def add_classes(self, java_classes: list[JavaClass], repository_url: str) -> None:
         """
@@ -117,24 +150,90 @@ class APIIndexer:
             repository_url: Repository URL these classes belong to
         """
         logger.info("Indexing %d classes from %s", len(java_classes), repository_url)
-        for java_class in java_classes:
-            self.add_class(java_class, repository_url)
+        if java_classes:
+            self._index_classes(java_classes, repository_url)
         logger.debug(
             "Indexing complete: total classes=%d, total methods=%d",
             self.get_total_classes(),
             self.get_total_methods(),
         )
 
+    def _index_classes(
+        self, java_classes: Sequence[JavaClass], repository_url: str
+    ) -> None:
+        """
+        Add a batch of Java classes to every index.
+
+        Classes are grouped by simple name and package first so each of those
+        buckets is extended once per batch rather than appended to per class.
+
+        Args:
+            java_classes: JavaClass objects to index
+            repository_url: Repository URL these classes belong to
+        """
+        by_name: dict[str, list[JavaClass]] = defaultdict(list)
+        by_package: dict[str, list[JavaClass]] = defaultdict(list)
+        method_count = 0
+
+        for java_class in java_classes:
+            # Index by fully-qualified name
+            fqn = java_class.fully_qualified_name
+            if fqn not in self.class_index:
+                self._add_lower_key(self.class_fqn_lower_index, fqn)
+            self.class_index[fqn] = java_class
+            self.class_repository_index[fqn] = repository_url
+
+            by_name[java_class.name].append(java_class)
+            by_package[java_class.package].append(java_class)
+
+            if java_class.methods:
+                method_count += self._index_methods(java_class)
+
+        # Index by simple class name
+        for name, classes in by_name.items():
+            if name not in self.class_name_index:
+                self._add_lower_key(self.class_name_lower_index, name)
+            self.class_name_index[name].extend(classes)
+
+        # Index by package
+        for package, classes in by_package.items():
+            self.package_index[package].extend(classes)
+
+        # Index by repository
+        self.repository_index[repository_url].extend(java_classes)
+
+        self._method_count += method_count
+        self._generation += 1
+        self._is_built = True
+
     def reindex_repository(
-        self, repository_url: str, java_classes: list[JavaClass]
+        self, repository_url: str, java_classes: list[JavaClass], force: bool = False
     ) -> None:
         """
         Re-index a repository by removing old entries and adding new ones.
 
+        When the repository is already indexed with an equal list of classes,
+        and still owns each of their fully-qualified names, the index is left
+        untouched. List comparison checks identity before equality, so passing
+        back the same class objects costs one pass over the list.
+
         Args:
             repository_url: Repository URL to re-index
             java_classes: New list of JavaClass objects
+            force: Rebuild the repository's entries even if they are unchanged
         """
+        if (
+            not force
+            and self.repository_index.get(repository_url) == java_classes
+            and all(
+                self.class_repository_index.get(c.fully_qualified_name)
+                == repository_url
+                for c in java_classes
+            )
+        ):
+            logger.debug("Repository unchanged, skipping re-index: %s", repository_url)
+            return
+
         logger.info(
             "Re-indexing repository: %s with %d classes",
             repository_url,
@@ -158,6 +257,23 @@ class APIIndexer:
         """
         return self.class_index.get(fully_qualified_name)
 
+    def get_class_by_fqn_ignore_case(
+        self, fully_qualified_name: str
+    ) -> Optional[JavaClass]:
+        """
+        Get a class by its fully-qualified name, ignoring case.
+
+        Args:
+            fully_qualified_name: Fully-qualified class name
+
+        Returns:
+            First indexed JavaClass whose name matches, or None if not found
+        """
+        fqns = self.class_fqn_lower_index.get(fully_qualified_name.lower())
+        if not fqns:
+            return None
+        return self.class_index[fqns[0]]
+
     def get_classes_by_name(self, class_name: str) -> list[JavaClass]:
         """
         Get classes by simple class name.
@@ -170,6 +286,21 @@ class APIIndexer:
         """
         return self.class_name_index.get(class_name, [])
 
+    def get_classes_by_name_ignore_case(self, class_name: str) -> list[JavaClass]:
+        """
+        Get classes by simple class name, ignoring case.
+
+        Args:
+            class_name: Simple class name
+
+        Returns:
+            List of matching JavaClass objects
+        """
+        results = []
+        for name in self.class_name_lower_index.get(class_name.lower(), []):
+            results.extend(self.class_name_index[name])
+        return results
+
     def get_classes_by_package(self, package_name: str) -> list[JavaClass]:
         """
         Get classes in a specific package.
@@ -194,6 +325,18 @@ class APIIndexer:
         """
         return self.repository_index.get(repository_url, [])
 
+    def get_repository_of_class(self, fully_qualified_name: str) -> Optional[str]:
+        """
+        Get the repository a class was indexed from.
+
+        Args:
+            fully_qualified_name: Fully-qualified class name
+
+        Returns:
+            Repository URL or None if the class is not indexed
+        """
+        return self.class_repository_index.get(fully_qualified_name)
+
     def get_methods_by_name(
         self, method_name: str
     ) -> list[tuple[JavaClass, JavaMethod]]:
@@ -208,6 +351,56 @@ class APIIndexer:
         """
         return self.method_index.get(method_name, [])
 
+    def get_methods_by_name_ignore_case(
+        self, method_name: str
+    ) -> list[tuple[JavaClass, JavaMethod]]:
+        """
+        Get methods by method name across all classes, ignoring case.
+
+        Args:
+            method_name: Method name to search for
+
+        Returns:
+            List of (JavaClass, JavaMethod) tuples
+        """
+        results = []
+        for name in self.method_name_lower_index.get(method_name.lower(), []):
+            results.extend(self.method_index[name])
+        return results
+
+    def find_method_names(self, pattern: str) -> list[str]:
+        """
+        Find indexed method names containing a pattern, ignoring case.
+
+        Patterns of up to NGRAM_SIZE characters are answered directly by the
+        n-gram index. Longer patterns only compare the names sharing every
+        trigram of the pattern.
+
+        Args:
+            pattern: Substring to look for
+
+        Returns:
+            Matching method names in indexing order
+        """
+        needle = pattern.lower()
+        lowered = self.method_name_lower
+        if not needle:
+            return list(lowered)
+        if len(needle) <= NGRAM_SIZE:
+            return list(self.method_ngram_index.get(needle, ()))
+
+        postings = []
+        for i in range(len(needle) - NGRAM_SIZE + 1):
+            names = self.method_ngram_index.get(needle[i : i + NGRAM_SIZE])
+            if not names:
+                return []
+            postings.append(names)
+        candidates = min(postings, key=len)
+
+        # str.__contains__ is CPython's two-way/Horspool fastsearch, so each
+        # check runs in C against the precomputed lowercase names
+        return [name for name in candidates if needle in lowered[name]]
+
     def get_methods_by_class(self, fully_qualified_name: str) -> list[JavaMethod]:
         """
         Get all methods for a specific class.
@@ -245,7 +438,7 @@ class APIIndexer:
         Returns:
             Total method count
         """
-        return sum(len(methods) for methods in self.class_method_index.values())
+        return self._method_count
 
     def is_built(self) -> bool:
         """
@@ -269,6 +462,14 @@ class APIIndexer:
         self.repository_index.clear()
         self.method_index.clear()
         self.class_method_index.clear()
+        self.class_repository_index.clear()
+        self.class_name_lower_index.clear()
+        self.class_fqn_lower_index.clear()
+        self.method_name_lower_index.clear()
+        self.method_name_lower.clear()
+        self.method_ngram_index.clear()
+        self._method_count = 0
+        self._generation += 1
         self._is_built = False
 
     def _remove_repository(self, repository_url: str) -> None:
@@ -280,44 +481,155 @@ class APIIndexer:
             return
 
         # Get classes to remove
-        classes_to_remove = self.repository_index[repository_url]
+        classes_to_remove = self.repository_index.pop(repository_url)
         logger.debug(
             "Removing %d classes from index for: %s",
             len(classes_to_remove),
             repository_url,
         )
 
+        # Collect the removed fully-qualified names per affected index key so
+        # each bucket is filtered once, instead of once per removed class
+        class_names: dict[str, set[str]] = defaultdict(set)
+        packages: dict[str, set[str]] = defaultdict(set)
+        method_names: dict[str, set[str]] = defaultdict(set)
+
         for java_class in classes_to_remove:
-            # Remove from class index
-            self.class_index.pop(java_class.fully_qualified_name, None)
-
-            # Remove from class name index
-            if java_class.name in self.class_name_index:
-                self.class_name_index[java_class.name] = [
-                    c
-                    for c in self.class_name_index[java_class.name]
-                    if c.fully_qualified_name != java_class.fully_qualified_name
-                ]
-
-            # Remove from package index
-            if java_class.package in self.package_index:
-                self.package_index[java_class.package] = [
-                    c
-                    for c in self.package_index[java_class.package]
-                    if c.fully_qualified_name != java_class.fully_qualified_name
-                ]
-
-            # Remove methods from method index
+            fqn = java_class.fully_qualified_name
+            class_names[java_class.name].add(fqn)
+            packages[java_class.package].add(fqn)
             for method in java_class.methods:
-                if method.name in self.method_index:
-                    self.method_index[method.name] = [
-                        (c, m)
-                        for c, m in self.method_index[method.name]
-                        if c.fully_qualified_name != java_class.fully_qualified_name
-                    ]
+                method_names[method.name].add(fqn)
+
+            # Remove from class -> repository index
+            if self.class_repository_index.get(fqn) == repository_url:
+                del self.class_repository_index[fqn]
+
+            # Remove from class index
+            if self.class_index.pop(fqn, None) is not None:
+                self._remove_from_list_index(
+                    self.class_fqn_lower_index, fqn.lower(), fqn
+                )
 
             # Remove from class method index
-            self.class_method_index.pop(java_class.fully_qualified_name, None)
+            removed_methods = self.class_method_index.pop(fqn, None)
+            if removed_methods:
+                self._method_count -= len(removed_methods)
+
+        # Remove from class name index
+        for name, removed_fqns in class_names.items():
+            if self._discard_from(self.class_name_index, name, removed_fqns):
+                self._remove_from_list_index(
+                    self.class_name_lower_index, name.lower(), name
+                )
+
+        # Remove from package index
+        for package, removed_fqns in packages.items():
+            self._discard_from(self.package_index, package, removed_fqns)
+
+        # Remove methods from method index
+        for method_name, removed_fqns in method_names.items():
+            if self._discard_from(
+                self.method_index, method_name, removed_fqns, itemgetter(0)
+            ):
+                self._unindex_method_name(method_name)
+
+        self._generation += 1
+
+    def _index_methods(self, java_class: JavaClass) -> int:
+        """
+        Add a class's methods to the method indices.
+
+        Args:
+            java_class: Class whose methods are indexed
+
+        Returns:
+            Number of methods indexed
+        """
+        method_index = self.method_index
+        methods = java_class.methods
+        for method in methods:
+            # Index lowercased name and n-grams the first time a name is seen
+            if method.name not in method_index:
+                self._index_method_name(method.name)
+
+            # Index by method name
+            method_index[method.name].append((java_class, method))
+
+        # Index by class name -> methods
+        self.class_method_index[java_class.fully_qualified_name].extend(methods)
+        return len(methods)
+
+    def _index_method_name(self, method_name: str) -> None:
+        """Add a method name to the lowercase and n-gram indices."""
+        lowered = self._add_lower_key(self.method_name_lower_index, method_name)
+        self.method_name_lower[method_name] = lowered
+        self._add_ngrams(method_name, lowered)
+
+    def _add_ngrams(self, method_name: str, lowered: str) -> None:
+        """Add a method name under each n-gram of its lowercased form."""
+        for ngram in _ngrams(lowered):
+            self.method_ngram_index[ngram][method_name] = None
+
+    @staticmethod
+    def _add_lower_key(index: dict[str, list[str]], name: str) -> str:
+        """Add name under its lowercased form and return that form."""
+        lowered = name.lower()
+        index[lowered].append(name)
+        return lowered
+
+    def _unindex_method_name(self, method_name: str) -> None:
+        """Remove a method name from the lowercase and n-gram indices."""
+        lowered = self.method_name_lower.pop(method_name, method_name.lower())
+        self._remove_from_list_index(self.method_name_lower_index, lowered, method_name)
+        for ngram in _ngrams(lowered):
+            names = self.method_ngram_index.get(ngram)
+            if names is None:
+                continue
+            names.pop(method_name, None)
+            if not names:
+                del self.method_ngram_index[ngram]
+
+    @staticmethod
+    def _discard_from(
+        index: dict[str, list],
+        key: str,
+        removed_fqns: set[str],
+        class_of: Callable[[Any], JavaClass] = lambda item: item,
+    ) -> bool:
+        """
+        Drop the entries of removed classes from index[key].
+
+        Args:
+            index: Index whose bucket is filtered
+            key: Bucket key
+            removed_fqns: Fully-qualified names of the removed classes
+            class_of: Returns the JavaClass an entry belongs to
 
-        # Remove repository entry
-        self.repository_index.pop(repository_url, None)
+        Returns:
+            True if the bucket became empty and its key was deleted
+        """
+        entries = index.get(key)
+        if entries is None:
+            return False
+        remaining = [
+            entry
+            for entry in entries
+            if class_of(entry).fully_qualified_name not in removed_fqns
+        ]
+        if remaining:
+            index[key] = remaining
+            return False
+        del index[key]
+        return True
+
+    @staticmethod
+    def _remove_from_list_index(index: dict[str, list], key: str, value) -> None:
+        """Remove value from index[key], dropping the key once empty."""
+        values = index.get(key)
+        if values is None:
+            return
+        if value in values:
+            values.remove(value)
+        if not values:
+            del index[key]
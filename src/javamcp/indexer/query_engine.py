@@ -39,7 +39,9 @@
 Query engine for searching and filtering indexed Java APIs.
 """
 
-from typing import Optional
+import threading
+from itertools import islice
+from typing import Iterable, Optional
 
 from javamcp.logging import get_logger
 from javamcp.models.java_entities import JavaClass, JavaMethod
@@ -50,6 +52,9 @@ from .indexer import APIIndexer
 # Module-level logger
 logger = get_logger("indexer.query")
 
+# Maximum number of keywords whose search results are kept by search_keyword
+KEYWORD_CACHE_SIZE = 1024
+
 
 class QueryEngine:
     """
@@ -65,6 +70,15 @@ class QueryEngine:
         """
         self.indexer = indexer
 
+        # Keyword -> (matching methods, matching classes), valid for the
+        # indexer generation stored alongside it
+        self._keyword_cache: dict[
+            str, tuple[list[tuple[JavaClass, JavaMethod]], list[JavaClass]]
+        ] = {}
+        self._keyword_cache_generation = indexer.generation
+        # Guards the keyword cache against concurrent tool calls
+        self._keyword_cache_lock = threading.Lock()
+
     def search_methods(
         self,
         method_name: str,
@@ -100,11 +114,7 @@ class QueryEngine:
         if case_sensitive:
             matching_methods = self.indexer.get_methods_by_name(method_name)
         else:
-            # Case-insensitive search
-            matching_methods = []
-            for name, methods in self.indexer.method_index.items():
-                if name.lower() == method_name.lower():
-                    matching_methods.extend(methods)
+            matching_methods = self.indexer.get_methods_by_name_ignore_case(method_name)
 
         # Apply class name filter if specified
         if class_name:
@@ -115,10 +125,11 @@ class QueryEngine:
                     if cls.name == class_name
                 ]
             else:
+                class_name_lower = class_name.lower()
                 results = [
                     (cls, method)
                     for cls, method in matching_methods
-                    if cls.name.lower() == class_name.lower()
+                    if cls.name.lower() == class_name_lower
                 ]
         else:
             results = matching_methods
@@ -152,14 +163,12 @@ class QueryEngine:
 
         results = []
 
-        # Search through all method names
-        for name, methods in self.indexer.method_index.items():
-            if case_sensitive:
-                if method_name_pattern in name:
-                    results.extend(methods)
-            else:
-                if method_name_pattern.lower() in name.lower():
-                    results.extend(methods)
+        # Candidate names come from the n-gram index; a case-sensitive match
+        # is always a case-insensitive one, so it only needs re-checking
+        for name in self.indexer.find_method_names(method_name_pattern):
+            if case_sensitive and method_name_pattern not in name:
+                continue
+            results.extend(self.indexer.method_index[name])
 
         logger.debug("Partial method search returned %d results", len(results))
         return results
@@ -191,13 +200,65 @@ class QueryEngine:
             logger.debug("Class search result: %s", "found" if result else "not found")
             return result
 
-        # Case-insensitive search
-        for fqn, java_class in self.indexer.class_index.items():
-            if fqn.lower() == class_name.lower():
-                logger.debug("Class search result: found (case-insensitive match)")
-                return java_class
-        logger.debug("Class search result: not found")
-        return None
+        result = self.indexer.get_class_by_fqn_ignore_case(class_name)
+        logger.debug(
+            "Class search result: %s",
+            "found (case-insensitive match)" if result else "not found",
+        )
+        return result
+
+    def repository_of(self, java_class: JavaClass) -> Optional[str]:
+        """
+        Get the repository URL an indexed class belongs to.
+
+        Args:
+            java_class: Indexed JavaClass
+
+        Returns:
+            Repository URL or None if the class is not indexed
+        """
+        return self.indexer.get_repository_of_class(java_class.fully_qualified_name)
+
+    def is_class_in_repository(
+        self, java_class: JavaClass, repository_url: str
+    ) -> bool:
+        """
+        Check whether an indexed class belongs to a repository.
+
+        Args:
+            java_class: Indexed JavaClass
+            repository_url: Repository URL to check against
+
+        Returns:
+            True if the class was indexed from the repository
+        """
+        return self.repository_of(java_class) == repository_url
+
+    def is_repository_indexed(self, repository_url: str) -> bool:
+        """
+        Check whether any classes have been indexed from a repository.
+
+        Args:
+            repository_url: Repository URL to check
+
+        Returns:
+            True if the repository has indexed classes
+        """
+        return bool(self.indexer.get_classes_by_repository(repository_url))
+
+    def check_repository_indexed(self, repository_url: str) -> None:
+        """
+        Ensure a repository has been indexed.
+
+        Args:
+            repository_url: Repository URL to check
+
+        Raises:
+            RepositoryNotIndexedError: If repository not in index
+        """
+        if not self.is_repository_indexed(repository_url):
+            logger.warning("Repository not indexed: %s", repository_url)
+            raise RepositoryNotIndexedError(f"Repository not indexed: {repository_url}")
 
     def filter_classes_by_repository(self, repository_url: str) -> list[JavaClass]:
         """
@@ -217,12 +278,9 @@ class QueryEngine:
         if not self.indexer.is_built():
             raise IndexNotBuiltError("Index has not been built")
 
+        self.check_repository_indexed(repository_url)
         classes = self.indexer.get_classes_by_repository(repository_url)
 
-        if not classes:
-            logger.warning("Repository not indexed: %s", repository_url)
-            raise RepositoryNotIndexedError(f"Repository not indexed: {repository_url}")
-
         logger.debug("Found %d classes in repository", len(classes))
         return classes
 
@@ -249,11 +307,7 @@ class QueryEngine:
 
         # Apply repository filter if specified
         if repository_url:
-            repo_classes = set(
-                c.fully_qualified_name
-                for c in self.indexer.get_classes_by_repository(repository_url)
-            )
-            classes = [c for c in classes if c.fully_qualified_name in repo_classes]
+            classes = [c for c in classes if self.repository_of(c) == repository_url]
 
         return classes
 
@@ -313,12 +367,100 @@ class QueryEngine:
         if case_sensitive:
             return self.indexer.get_classes_by_name(class_name)
 
-        # Case-insensitive search
-        results = []
-        for name, classes in self.indexer.class_name_index.items():
-            if name.lower() == class_name.lower():
-                results.extend(classes)
-        return results
+        return self.indexer.get_classes_by_name_ignore_case(class_name)
+
+    def search_keyword(
+        self, keyword: str
+    ) -> tuple[list[tuple[JavaClass, JavaMethod]], list[JavaClass]]:
+        """
+        Find methods and classes matching a use case keyword, ignoring case.
+
+        Combines a partial method name search with a simple class name
+        lookup. Results are memoized per keyword until the index changes;
+        callers must not mutate the returned lists.
+
+        Args:
+            keyword: Keyword to search for
+
+        Returns:
+            Tuple of (matching (JavaClass, JavaMethod) pairs, matching classes)
+
+        Raises:
+            IndexNotBuiltError: If index is not built
+        """
+        with self._keyword_cache_lock:
+            generation = self.indexer.generation
+            if self._keyword_cache_generation != generation:
+                self._keyword_cache.clear()
+                self._keyword_cache_generation = generation
+
+            cached = self._keyword_cache.get(keyword)
+        if cached is not None:
+            return cached
+
+        result = (
+            self.search_methods_partial(keyword, case_sensitive=False),
+            self.get_classes_by_name(keyword, case_sensitive=False),
+        )
+        with self._keyword_cache_lock:
+            # Results computed against an index that has since changed are
+            # returned but not cached
+            if self._keyword_cache_generation == generation:
+                if len(self._keyword_cache) >= KEYWORD_CACHE_SIZE:
+                    # Evict the oldest entry
+                    cache = self._keyword_cache
+                    cache.pop(next(iter(cache)))
+                self._keyword_cache[keyword] = result
+        return result
+
+    def search_any(
+        self, keywords: Iterable[str], max_results: int
+    ) -> tuple[list[JavaClass], list[JavaMethod]]:
+        """
+        Find distinct classes and methods matching any of several keywords.
+
+        The result budget is spread across keywords, so earlier keywords do
+        not crowd out later ones, and the search stops as soon as enough
+        distinct APIs have been collected.
+
+        Args:
+            keywords: Keywords to search for, most relevant first
+            max_results: Maximum number of classes and of methods to return
+
+        Returns:
+            Tuple of (matching classes, matching methods)
+
+        Raises:
+            IndexNotBuiltError: If index is not built
+        """
+        keywords = tuple(keywords)
+        if not keywords:
+            return [], []
+
+        # Ordered, de-duplicated accumulators keyed by object identity
+        seen_classes: dict[int, JavaClass] = {}
+        seen_methods: dict[int, JavaMethod] = {}
+        per_keyword = max(1, max_results // len(keywords))
+
+        for keyword in islice(keywords, max_results):
+            methods, classes = self.search_keyword(keyword)
+
+            if len(seen_methods) < max_results:
+                for _, method in islice(methods, per_keyword):
+                    seen_methods.setdefault(id(method), method)
+                    if len(seen_methods) >= max_results:
+                        break
+
+            if len(seen_classes) < max_results:
+                for java_class in islice(classes, per_keyword):
+                    seen_classes.setdefault(id(java_class), java_class)
+                    if len(seen_classes) >= max_results:
+                        break
+
+            if len(seen_methods) >= max_results and len(seen_classes) >= max_results:
+                break
+
+        return list(seen_classes.values()), list(seen_methods.values())
 
     def get_statistics(self) -> dict[str, int]:
         """
@@ -341,8 +341,11 @@ def log_tool_invocation(logger: logging.Logger, tool_name: str, **params) -> Non
         tool_name: Name of the tool being invoked
         **params: Tool parameters
     """
+    # Skip formatting the parameters when the message would be discarded
+    if not logger.isEnabledFor(logging.INFO):
+        return
     param_str = ", ".join(f"{k}={v}" for k, v in params.items())
-    logger.info(f"Tool invocation: {tool_name}({param_str})")
+    logger.info("Tool invocation: %s(%s)", tool_name, param_str)
 
 
 def log_repository_operation(
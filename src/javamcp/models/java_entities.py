@@ -169,7 +169,7 @@ class JavaMethod(BaseModel):
     @property
     def signature(self) -> str:
         """Generate method signature string."""
-        params = ", ".join(f"{p.type} {p.name}" for p in self.parameters)
+        params = ", ".join([p.type + " " + p.name for p in self.parameters])
         return f"{self.return_type} {self.name}({params})"
 
 
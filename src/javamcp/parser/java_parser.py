@@ -39,7 +39,9 @@
 ANTLR4 wrapper for parsing Java source files.
 """
 
+import sys
 from pathlib import Path
+from typing import Iterable, Iterator, Optional
 
 from antlr4 import CommonTokenStream, FileStream, InputStream
 from antlr4.error.ErrorListener import ErrorListener
@@ -55,6 +57,9 @@ from .exceptions import InvalidJavaSourceError, ParseError
 # Module-level logger
 logger = get_logger("parser.java")
 
+# Source files that never declare a type, so class extraction always fails
+NON_TYPE_SOURCE_FILES = frozenset({"package-info.java", "module-info.java"})
+
 
 class JavaParseErrorListener(ErrorListener):
     """Custom error listener to capture parsing errors."""
@@ -104,14 +109,54 @@ class JavaSourceParser:
             logger.error("Not a file: %s", file_path)
             raise InvalidJavaSourceError(f"Not a file: {file_path}")
 
-        try:
-            input_stream = FileStream(str(path), encoding="utf-8")
-            result = self._parse_stream(input_stream, str(path))
-            log_parse_operation(logger, file_path, "success")
-            return result
-        except Exception as e:
-            log_parse_operation(logger, file_path, "failed", str(e))
-            raise ParseError(f"Failed to parse file {file_path}: {e}") from e
+        java_class, error = self._parse_file_result(path)
+        if java_class is None:
+            raise ParseError(f"Failed to parse file {file_path}: {error}")
+        return java_class
+
+    def try_parse_file(self, file_path: str) -> Optional[JavaClass]:
+        """
+        Parse a Java source file, returning None instead of raising on failure.
+
+        Meant for bulk extraction, where unparseable files are skipped. The
+        expected failures (missing files, syntax errors, sources without a
+        type declaration) are logged without raising exceptions.
+
+        Args:
+            file_path: Path to Java source file
+
+        Returns:
+            JavaClass model, or None if the file could not be parsed
+        """
+        path = Path(file_path)
+        if path.name in NON_TYPE_SOURCE_FILES:
+            logger.debug("Skipping source without type declaration: %s", file_path)
+            return None
+
+        if not path.is_file():
+            log_parse_operation(logger, file_path, "failed", "Not a file")
+            return None
+
+        return self._parse_file_result(path)[0]
+
+    def parse_files(
+        self, file_paths: Iterable[str]
+    ) -> Iterator[tuple[str, Optional[JavaClass]]]:
+        """
+        Lazily parse several Java source files with this parser.
+
+        Failures are handled as in try_parse_file, so a bad file yields None
+        instead of interrupting the batch.
+
+        Args:
+            file_paths: Paths to Java source files
+
+        Yields:
+            Tuples of (file path, JavaClass or None if the file was skipped)
+        """
+        try_parse_file = self.try_parse_file
+        for file_path in file_paths:
+            yield file_path, try_parse_file(file_path)
 
     def parse_string(
         self, source_code: str, source_name: str = "<string>"
@@ -156,27 +201,77 @@ class JavaSourceParser:
         Raises:
             InvalidJavaSourceError: If parsing fails
         """
-        # Reset error listener
-        self.error_listener.errors.clear()
+        java_class, error = self._parse_stream_result(input_stream, source_name)
+        if java_class is None:
+            raise InvalidJavaSourceError(error)
+        return java_class
+
+    def _parse_file_result(
+        self, path: Path
+    ) -> tuple[Optional[JavaClass], Optional[str]]:
+        """
+        Parse an existing Java source file, reporting failure as a value.
+
+        Shared by parse_file and try_parse_file, which differ only in how
+        they validate the path and surface the failure. The outcome is logged
+        either way.
+
+        Args:
+            path: Path to an existing Java source file
+
+        Returns:
+            Tuple of (JavaClass, None) on success or (None, error message)
+        """
+        file_path = str(path)
+        try:
+            input_stream = FileStream(file_path, encoding="utf-8")
+            java_class, error = self._parse_stream_result(input_stream, file_path)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            java_class, error = None, str(e)
+
+        if java_class is None:
+            log_parse_operation(logger, file_path, "failed", error)
+            return None, error
+
+        log_parse_operation(logger, file_path, "success")
+        return java_class, None
+
+    def _parse_stream_result(
+        self, input_stream, source_name: str
+    ) -> tuple[Optional[JavaClass], Optional[str]]:
+        """
+        Parse Java source from input stream, reporting failure as a value.
+
+        Args:
+            input_stream: ANTLR4 input stream
+            source_name: Source name for error messages
+
+        Returns:
+            Tuple of (JavaClass, None) on success or (None, error message)
+        """
+        # Fresh error listener per parse so a shared parser instance can be
+        # used from concurrent tool calls
+        error_listener = JavaParseErrorListener()
+        self.error_listener = error_listener
 
         # Create lexer and parser
         lexer = JavaLexer(input_stream)
         lexer.removeErrorListeners()
-        lexer.addErrorListener(self.error_listener)
+        lexer.addErrorListener(error_listener)
 
         stream = CommonTokenStream(lexer)
         parser = JavaParser(stream)
         parser.removeErrorListeners()
-        parser.addErrorListener(self.error_listener)
+        parser.addErrorListener(error_listener)
 
         # Parse compilation unit
         tree = parser.compilationUnit()
 
         # Check for errors
-        if self.error_listener.errors:
-            error_msg = "; ".join(self.error_listener.errors)
+        if error_listener.errors:
+            error_msg = "; ".join(error_listener.errors)
             logger.warning("Parse errors in %s: %s", source_name, error_msg)
-            raise InvalidJavaSourceError(f"Parse errors in {source_name}: {error_msg}")
+            return None, f"Parse errors in {source_name}: {error_msg}"
 
         # Extract package and imports
         package_name = self._extract_package(tree)
@@ -188,7 +283,7 @@ class JavaSourceParser:
 
         if java_class is None:
             logger.warning("No class definition found in %s", source_name)
-            raise InvalidJavaSourceError(f"No class definition found in {source_name}")
+            return None, f"No class definition found in {source_name}"
 
         logger.debug(
             "Successfully parsed %s: class=%s, methods=%d",
@@ -196,14 +291,19 @@ class JavaSourceParser:
             java_class.name,
             len(java_class.methods),
         )
-        return java_class
+        return java_class, None
 
     def _extract_package(self, tree) -> str:
-        """Extract package declaration from parse tree."""
+        """
+        Extract package declaration from parse tree.
+
+        The name is interned because every class in a package repeats it, so
+        the parsed classes and the indexer's package keys share one string.
+        """
         if tree.packageDeclaration():
             package_ctx = tree.packageDeclaration()
             if package_ctx.qualifiedName():
-                return package_ctx.qualifiedName().getText()
+                return sys.intern(package_ctx.qualifiedName().getText())
         return ""
 
     def _extract_imports(self, tree) -> list[str]:
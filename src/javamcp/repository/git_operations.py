@@ -57,6 +57,8 @@ def clone_repository(
     """
     Clone a Git repository from URL to local path.
 
+    Only the requested (or default) branch is fetched.
+
     Args:
         url: Git repository URL
         local_path: Local filesystem path for cloning
@@ -79,9 +81,11 @@ def clone_repository(
     try:
         # Only pass branch parameter if explicitly specified
         if branch is not None:
-            repo = Repo.clone_from(url, local_path, branch=branch, depth=depth)
+            repo = Repo.clone_from(
+                url, local_path, branch=branch, depth=depth, single_branch=True
+            )
         else:
-            repo = Repo.clone_from(url, local_path, depth=depth)
+            repo = Repo.clone_from(url, local_path, depth=depth, single_branch=True)
         logger.debug("Clone successful: %s", url)
         return repo
     except GitCommandError as e:
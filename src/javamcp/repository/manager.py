@@ -39,9 +39,12 @@
 Repository manager for handling multiple Git repositories.
 """
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from javamcp.config.schema import RepositoryConfig
 from javamcp.logging import get_logger, log_repository_operation
@@ -59,6 +62,43 @@ from .git_operations import (
 # Module-level logger
 logger = get_logger("repository.manager")
 
+# Upper bound on concurrent clone/pull operations during initialization
+MAX_CLONE_WORKERS = 8
+
+# Maximum number of cached Java file listings kept by get_java_files_cached
+JAVA_FILES_CACHE_SIZE = 64
+
+
+def _walk_java_files(root: str) -> Iterator[str]:
+    """
+    Walk a directory tree and yield the paths of the Java source files in it.
+
+    Uses os.scandir so each entry's type comes from the directory listing
+    instead of a separate stat call, and yields plain strings so callers that
+    only need strings never build Path objects. Files are yielded in the same
+    top-down order as Path.rglob; symlinked directories are not followed and
+    unreadable ones are skipped.
+
+    Args:
+        root: Directory to walk, normalized as str(Path(root)) would be
+
+    Returns:
+        Iterator of path strings for files ending in .java
+    """
+    stack = [root]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.endswith(".java"):
+                        yield entry.path
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
 
 class RepositoryManager:
     """
@@ -75,6 +115,17 @@ class RepositoryManager:
         self.config = config
         self.repositories: dict[str, RepositoryMetadata] = {}
         self.indices: dict[str, RepositoryIndex] = {}
+        # Per checkout directory locks, so ensure_repository never clones into
+        # one directory twice at once while other repositories proceed
+        self._checkout_locks: dict[Path, threading.Lock] = {}
+        self._checkout_locks_lock = threading.Lock()
+        # Java file listings keyed by (url, package_filter, commit_hash); only
+        # listings of repositories with a known commit are stored
+        self._java_files_cache: dict[
+            tuple[str, Optional[str], Optional[str]], tuple[str, ...]
+        ] = {}
+        # Guards the listing cache against concurrent extract_apis calls
+        self._java_files_cache_lock = threading.Lock()
 
     def initialize_repositories(self) -> None:
         """
@@ -88,32 +139,88 @@ class RepositoryManager:
         base_path = Path(self.config.local_base_path)
         base_path.mkdir(parents=True, exist_ok=True)
 
+        # URLs sharing a checkout directory (duplicates, or the same repository
+        # name on different hosts) must not be cloned into it concurrently, so
+        # each directory's URLs are initialized serially by a single worker
+        urls_by_path: dict[Path, list[str]] = {}
         for url in self.config.urls:
-            repo_name = self._get_repo_name_from_url(url)
-            local_path = base_path / repo_name
-            logger.debug("Processing repository: %s -> %s", url, local_path)
-
-            if local_path.exists() and is_git_repository(str(local_path)):
-                # Repository already exists
-                if self.config.auto_update:
-                    logger.info("Updating existing repository: %s", repo_name)
-                    self._update_repository(url, str(local_path))
-                else:
-                    logger.debug(
-                        "Loading existing repository (auto_update=False): %s",
-                        repo_name,
-                    )
-                    self._load_existing_repository(url, str(local_path))
-            else:
-                # Clone new repository
-                logger.info("Cloning new repository: %s", repo_name)
-                self._clone_new_repository(url, str(local_path))
+            urls_by_path.setdefault(self._get_local_path(url), []).append(url)
+
+        if urls_by_path:
+            # Clones and pulls are network bound and run in git subprocesses,
+            # so threads overlap them and wall time approaches the slowest repo
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_CLONE_WORKERS, len(urls_by_path))
+            ) as executor:
+                list(executor.map(self._initialize_serially, urls_by_path.values()))
 
         logger.info(
             "Repository initialization complete: %d repositories loaded",
             len(self.repositories),
         )
 
+    def _initialize_serially(self, urls: list[str]) -> None:
+        """Initialize repositories one after another, in the given order."""
+        for url in urls:
+            self.initialize_repository(url)
+
+    def initialize_repository(self, url: str) -> None:
+        """
+        Initialize a single repository: clone it if missing, otherwise
+        update or load the existing checkout.
+
+        Args:
+            url: Repository URL
+        """
+        local_path = self._get_local_path(url)
+        repo_name = local_path.name
+        logger.debug("Processing repository: %s -> %s", url, local_path)
+
+        if local_path.exists() and is_git_repository(str(local_path)):
+            # Repository already exists
+            if self.config.auto_update:
+                logger.info("Updating existing repository: %s", repo_name)
+                self._update_repository(url, str(local_path))
+            else:
+                logger.debug(
+                    "Loading existing repository (auto_update=False): %s",
+                    repo_name,
+                )
+                self._load_existing_repository(url, str(local_path))
+        else:
+            # Clone new repository
+            logger.info("Cloning new repository: %s", repo_name)
+            self._clone_new_repository(url, str(local_path))
+
+    def ensure_repository(self, url: str) -> RepositoryMetadata:
+        """
+        Make a repository available locally, reusing it if already managed.
+
+        Repositories that are already tracked are returned as-is, without
+        another clone or pull. Unknown URLs are initialized like configured
+        ones and tracked from then on.
+
+        Args:
+            url: Repository URL
+
+        Returns:
+            RepositoryMetadata for the repository
+        """
+        metadata = self.repositories.get(url)
+        if metadata is not None:
+            logger.debug("Repository already available: %s", url)
+            return metadata
+
+        with self._get_checkout_lock(self._get_local_path(url)):
+            # Another call may have initialized it while this one waited
+            metadata = self.repositories.get(url)
+            if metadata is not None:
+                return metadata
+
+            Path(self.config.local_base_path).mkdir(parents=True, exist_ok=True)
+            self.initialize_repository(url)
+            return self.repositories[url]
+
     def clone_all_repositories(self) -> None:
         """
         Clone all configured repositories (skip if already exists).
@@ -153,28 +260,90 @@ class RepositoryManager:
         self._update_repository(url, metadata.local_path)
         log_repository_operation(logger, "update", url, "success")
 
-    def get_java_files(self, url: str) -> list[Path]:
+    def iter_java_files(self, url: str) -> Iterator[Path]:
         """
-        Get list of all Java files in a repository.
+        Lazily iterate over all Java files in a repository.
+
+        The repository is validated immediately; files are yielded while the
+        directory tree is being walked.
 
         Args:
             url: Repository URL
 
         Returns:
-            List of Path objects for Java files
+            Iterator of Path objects for Java files
+
+        Raises:
+            RepositoryNotFoundError: If repository not found
+        """
+        return map(Path, self._iter_java_file_paths(url))
+
+    def iter_java_files_by_package(self, url: str, package_path: str) -> Iterator[Path]:
+        """
+        Lazily iterate over Java files matching a package path.
+
+        Args:
+            url: Repository URL
+            package_path: Package path (e.g., "com/example/service")
+
+        Returns:
+            Iterator of Path objects matching package path
 
         Raises:
             RepositoryNotFoundError: If repository not found
         """
+        return map(Path, self._iter_package_file_paths(url, package_path))
+
+    def _iter_java_file_paths(self, url: str) -> Iterator[str]:
+        """Validate the repository and lazily walk its Java file path strings."""
         logger.debug("Getting Java files for repository: %s", url)
         if url not in self.repositories:
             logger.error("Repository not managed: %s", url)
             raise RepositoryNotFoundError(f"Repository not managed: {url}")
 
-        metadata = self.repositories[url]
-        repo_path = Path(metadata.local_path)
+        return _walk_java_files(str(Path(self.repositories[url].local_path)))
+
+    def _iter_package_file_paths(self, url: str, package_path: str) -> Iterator[str]:
+        """
+        Lazily iterate over path strings of Java files matching a package path.
+
+        A file matches when the package path leads its directory path relative
+        to the repository, or when its parent directory has the package path's
+        last name. The package path is split once and compared with each file's
+        string parts, so no Path objects are built per file.
+        """
+        java_files = self._iter_java_file_paths(url)
+        root = str(Path(self.repositories[url].local_path))
+        prefix_length = len(root) if root.endswith(os.sep) else len(root) + 1
+        root_name = os.path.basename(root)
+        package = Path(package_path)
+        package_parts = package.parts
+        package_name = package.name
+        depth = len(package_parts)
+
+        def matches(file_path: str) -> bool:
+            dir_parts = file_path[prefix_length:].split(os.sep)[:-1]
+            parent_name = dir_parts[-1] if dir_parts else root_name
+            return (
+                tuple(dir_parts[:depth]) == package_parts or parent_name == package_name
+            )
+
+        return filter(matches, java_files)
+
+    def get_java_files(self, url: str) -> list[Path]:
+        """
+        Get list of all Java files in a repository.
+
+        Args:
+            url: Repository URL
 
-        java_files = list(repo_path.rglob("*.java"))
+        Returns:
+            List of Path objects for Java files
+
+        Raises:
+            RepositoryNotFoundError: If repository not found
+        """
+        java_files = list(self.iter_java_files(url))
         logger.debug("Found %d Java files in %s", len(java_files), url)
         return java_files
 
@@ -192,17 +361,54 @@ class RepositoryManager:
         Raises:
             RepositoryNotFoundError: If repository not found
         """
-        all_files = self.get_java_files(url)
-        package_parts = Path(package_path)
+        return list(self.iter_java_files_by_package(url, package_path))
+
+    def get_java_files_cached(
+        self, url: str, package_filter: Optional[str] = None
+    ) -> tuple[str, ...]:
+        """
+        Get Java file paths in a repository, reusing earlier directory walks.
+
+        Listings are keyed by the repository's current commit, so a pull that
+        moves HEAD invalidates them. Repositories without a known commit are
+        walked on every call.
+
+        Args:
+            url: Repository URL
+            package_filter: Optional package path (e.g., "com/example/service")
 
-        filtered = [
-            f
-            for f in all_files
-            if package_parts in f.relative_to(self.repositories[url].local_path).parents
-            or f.parent.name == package_parts.name
-        ]
+        Returns:
+            Tuple of Java file paths as strings
 
-        return filtered
+        Raises:
+            RepositoryNotFoundError: If repository not found
+        """
+        if url not in self.repositories:
+            logger.error("Repository not managed: %s", url)
+            raise RepositoryNotFoundError(f"Repository not managed: {url}")
+
+        commit_hash = self.repositories[url].commit_hash
+        key = (url, package_filter, commit_hash)
+        if commit_hash is not None:
+            with self._java_files_cache_lock:
+                cached = self._java_files_cache.get(key)
+            if cached is not None:
+                logger.debug("Using cached Java file listing for %s", url)
+                return cached
+
+        if package_filter:
+            file_paths = tuple(self._iter_package_file_paths(url, package_filter))
+        else:
+            file_paths = tuple(self._iter_java_file_paths(url))
+
+        if commit_hash is not None:
+            with self._java_files_cache_lock:
+                cache = self._java_files_cache
+                if len(cache) >= JAVA_FILES_CACHE_SIZE:
+                    # Evict the oldest entry
+                    cache.pop(next(iter(cache)))
+                cache[key] = file_paths
+        return file_paths
 
     def get_repository_metadata(self, url: str) -> Optional[RepositoryMetadata]:
         """
@@ -255,6 +461,15 @@ class RepositoryManager:
             name = name[:-4]
         return name
 
+    def _get_local_path(self, url: str) -> Path:
+        """Get the local checkout directory for a repository URL."""
+        return Path(self.config.local_base_path) / self._get_repo_name_from_url(url)
+
+    def _get_checkout_lock(self, local_path: Path) -> threading.Lock:
+        """Get the lock serializing initialization of a checkout directory."""
+        with self._checkout_locks_lock:
+            return self._checkout_locks.setdefault(local_path, threading.Lock())
+
     def _clone_new_repository(self, url: str, local_path: str) -> None:
         """Clone a new repository and track metadata."""
         logger.info("Cloning repository %s to %s", url, local_path)
@@ -42,7 +42,7 @@ Project context builder for generating comprehensive project documentation.
 from pathlib import Path
 from typing import Optional
 
-from javamcp.context.context_builder import ContextBuilder
+from javamcp.context.context_builder import ContextBuilder, get_context_builder
 from javamcp.indexer.indexer import APIIndexer
 from javamcp.indexer.query_engine import QueryEngine
 from javamcp.logging import get_logger
@@ -65,6 +65,7 @@ class ProjectContextBuilder:
         repository_manager: RepositoryManager,
         indexer: APIIndexer,
         query_engine: QueryEngine,
+        context_builder: Optional[ContextBuilder] = None,
     ):
         """
         Initialize project context builder.
@@ -73,11 +74,12 @@ class ProjectContextBuilder:
             repository_manager: Repository manager for accessing repo files
             indexer: API indexer for accessing indexed classes
             query_engine: Query engine for searching APIs
+            context_builder: Context builder to use (default: shared instance)
         """
         self.repository_manager = repository_manager
         self.indexer = indexer
         self.query_engine = query_engine
-        self.context_builder = ContextBuilder()
+        self.context_builder = context_builder or get_context_builder()
 
     def build_project_context(self, repository_url: str) -> dict:
         """
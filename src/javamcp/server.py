@@ -42,14 +42,29 @@ This module uses lazy initialization via server_factory to ensure logging
 is configured before FastMCP instantiation.
 """
 
-from typing import Optional
+import multiprocessing
+import os
+import re
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import TYPE_CHECKING, Optional
+
+from pydantic import BaseModel
 
 from javamcp.config.loader import load_config
-from javamcp.config.schema import ApplicationConfig, RepositoryConfig
-from javamcp.context.context_builder import ContextBuilder
+from javamcp.config.schema import ApplicationConfig
+from javamcp.context.context_builder import ContextBuilder, get_context_builder
+from javamcp.context.guide_builder import (
+    extract_keywords,
+    format_guide,
+)
 from javamcp.indexer.indexer import APIIndexer
 from javamcp.indexer.query_engine import QueryEngine
 from javamcp.logging import get_logger, log_tool_invocation
+from javamcp.models.java_entities import JavaClass
 from javamcp.models.mcp_protocol import (
     AnalyzeClassRequest,
     AnalyzeClassResponse,
@@ -59,31 +74,176 @@ from javamcp.models.mcp_protocol import (
     GenerateGuideResponse,
     ProjectContextResponse,
     SearchMethodsRequest,
-    SearchMethodsResponse,
 )
-from javamcp.parser.java_parser import JavaSourceParser
 from javamcp.repository.manager import RepositoryManager
 from javamcp.resources.project_context_builder import ProjectContextBuilder
 from javamcp.server_factory import get_mcp_server
 
+if TYPE_CHECKING:
+    from javamcp.parser.java_parser import JavaSourceParser
+
 # Module-level logger for server operations
 logger = get_logger("server")
 
 
-# Global state for shared components
-class ServerState:
+# Minimum number of Java files before extract_apis parses in worker processes
+PARALLEL_PARSE_MIN_FILES = 64
+
+# Number of files handed to a parser worker process at a time
+PARSE_CHUNK_SIZE = 16
+
+# Parser reused by all files parsed in the same worker process
+_worker_parser: Optional["JavaSourceParser"] = None
+
+# Worker processes shared by all extract_apis calls (created on first use)
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+def _init_worker() -> None:
+    """
+    Create the per-process Java source parser for extract_apis workers.
+
+    Used as the ProcessPoolExecutor initializer so each worker imports the
+    parser and builds it once, before its first file arrives.
+    """
+    global _worker_parser  # pylint: disable=global-statement
+    # pylint: disable-next=import-outside-toplevel
+    from javamcp.parser.java_parser import JavaSourceParser
+
+    _worker_parser = JavaSourceParser()
+
+
+def _parse_one(
+    file_path: str, class_pattern: Optional[re.Pattern] = None
+) -> Optional[JavaClass]:
+    """
+    Parse a Java file in a worker process for extract_apis.
+
+    Args:
+        file_path: Path to Java source file
+        class_pattern: Optional pattern the class name must contain a match for
+
+    Returns:
+        Parsed JavaClass, or None if parsing failed or the class is filtered out
+    """
+    if _worker_parser is None:
+        _init_worker()
+
+    java_class = _worker_parser.try_parse_file(file_path)
+    if java_class is None:
+        return None
+    # Drop filtered classes before they are pickled back to the server
+    if class_pattern and not class_pattern.search(java_class.name):
+        return None
+    return java_class
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """
+    Return the extract_apis worker pool, creating it on first use.
+
+    Workers are started with the "spawn" method rather than forked: tools run
+    in FastMCP worker threads, and forking a multithreaded process can leave
+    the child blocked on a lock another thread held at fork time. The pool is
+    kept for the life of the server, so each worker imports the ANTLR parser
+    once instead of on every extract_apis call.
+
+    Returns:
+        Shared ProcessPoolExecutor
+    """
+    global _parse_pool  # pylint: disable=global-statement
+
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return _parse_pool
+
+
+def _discard_parse_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Drop a broken worker pool so the next extract_apis call starts a new one.
+
+    Args:
+        pool: Pool whose worker processes terminated abruptly
+    """
+    global _parse_pool  # pylint: disable=global-statement
+
+    with _parse_pool_lock:
+        if _parse_pool is pool:
+            _parse_pool = None
+    pool.shutdown(wait=False)
+
+
+# Global state for shared components; one attribute per shared component
+# or cache, so tools and tests can reach each directly
+class ServerState:  # pylint: disable=too-many-instance-attributes
     """Shared server state accessible to all tools."""
 
     config: Optional[ApplicationConfig] = None
     repository_manager: Optional[RepositoryManager] = None
     indexer: Optional[APIIndexer] = None
     query_engine: Optional[QueryEngine] = None
+    context_builder: Optional[ContextBuilder] = None
+    parser: Optional["JavaSourceParser"] = None
+    # Repository URL -> (indexer generation, rendered project context JSON)
+    project_context_cache: dict[str, tuple[int, str]] = {}
     initialized: bool = False
 
 
 _state = ServerState()
 
 
+def _get_parser() -> "JavaSourceParser":
+    """
+    Return the shared Java source parser, creating it on first use.
+
+    The generated ANTLR parser modules are the slowest part of the package to
+    import, so they are only loaded once a tool actually parses source files.
+
+    Returns:
+        JavaSourceParser instance stored in the server state
+    """
+    if _state.parser is None:
+        # pylint: disable-next=import-outside-toplevel
+        from javamcp.parser.java_parser import JavaSourceParser
+
+        _state.parser = JavaSourceParser()
+    return _state.parser
+
+
+# Serialized form of indexed entities, keyed by object identity. Parsed
+# classes and methods are not modified after indexing, so a dump stays valid
+# for as long as the object is alive.
+_dump_cache: dict[int, dict] = {}
+
+
+def _dump_cached(model: BaseModel) -> dict:
+    """
+    Return ``model.model_dump()``, memoized per model instance.
+
+    The entry is dropped when the model is garbage collected, so the cache
+    never outlives re-indexing. Callers must not mutate the returned dict.
+
+    Args:
+        model: Indexed Pydantic model (JavaClass or JavaMethod)
+
+    Returns:
+        Dictionary representation of the model
+    """
+    key = id(model)
+    dumped = _dump_cache.get(key)
+    if dumped is None:
+        dumped = model.model_dump()
+        _dump_cache[key] = dumped
+        weakref.finalize(model, _dump_cache.pop, key, None)
+    return dumped
+
+
 def initialize_server(config_path: str = None) -> None:
     """
     Initialize the JavaMCP server with configuration.
@@ -101,6 +261,10 @@ def initialize_server(config_path: str = None) -> None:
 
     _state.indexer = APIIndexer()
     _state.query_engine = QueryEngine(_state.indexer)
+    _state.context_builder = get_context_builder()
+    # Created on first use by _get_parser()
+    _state.parser = None
+    _state.project_context_cache = {}
 
     # Initialize repositories
     logger.info("Initializing repositories: %s", _state.config.repositories.urls)
@@ -176,8 +340,6 @@ def search_methods(
         case_sensitive=case_sensitive,
     )
 
-    context_builder = ContextBuilder()
-
     # Search for methods
     results = _state.query_engine.search_methods(
         request.method_name,
@@ -185,24 +347,24 @@ def search_methods(
         case_sensitive=request.case_sensitive,
     )
 
-    # Build rich context for each method
-    methods_with_context = []
-    for java_class, method in results:
-        context_builder.build_method_context(method, java_class)
-        methods_with_context.append(method.model_dump())
-
-    response = SearchMethodsResponse(
-        methods=methods_with_context,
-        total_found=len(methods_with_context),
-        query=request,
-    )
+    methods_with_context = [method for _, method in results]
 
     logger.info(
         "search_methods completed: found %d methods matching '%s'",
         len(methods_with_context),
         method_name,
     )
-    return response.model_dump()
+    # Same shape as SearchMethodsResponse.model_dump(), assembled from cached
+    # method dumps without a model round-trip
+    return {
+        "methods": [_dump_cached(method) for method in methods_with_context],
+        "total_found": len(methods_with_context),
+        "query": {
+            "method_name": request.method_name,
+            "class_name": request.class_name,
+            "case_sensitive": request.case_sensitive,
+        },
+    }
 
 
 # Tool: Analyze Class
@@ -239,8 +401,6 @@ def analyze_class(
         repository_name=repository_name,
     )
 
-    context_builder = ContextBuilder()
-
     # Search for the class
     java_class = _state.query_engine.search_class(request.fully_qualified_name)
 
@@ -250,18 +410,15 @@ def analyze_class(
         return response.model_dump()
 
     # If repository filter specified, verify class is from that repository
-    if request.repository_name:
-        repo_classes = _state.query_engine.filter_classes_by_repository(
-            request.repository_name
-        )
-        if java_class not in repo_classes:
-            response = AnalyzeClassResponse(found=False, matches=0)
-            return response.model_dump()
-
-    # Build rich context
-    context_builder.build_class_context(java_class, include_methods=True)
+    if request.repository_name and not _state.query_engine.is_class_in_repository(
+        java_class, request.repository_name
+    ):
+        # Still reject repositories that are not indexed at all
+        _state.query_engine.check_repository_indexed(request.repository_name)
+        response = AnalyzeClassResponse(found=False, matches=0)
+        return response.model_dump()
 
-    response = AnalyzeClassResponse(
+    response = AnalyzeClassResponse.model_construct(
         java_class=java_class,
         found=True,
         matches=1,
@@ -272,7 +429,9 @@ def analyze_class(
         fully_qualified_name,
         len(java_class.methods),
     )
-    return response.model_dump()
+    result = response.model_dump(exclude={"java_class"})
+    result["java_class"] = _dump_cached(java_class)
+    return result
 
 
 # Tool: Extract APIs
@@ -285,8 +444,9 @@ def extract_apis(  # pylint: disable=too-many-locals
     """
     Extract Java APIs from a Git repository.
 
-    Clones/updates repository, parses Java files, and indexes APIs with
-    rich context including javadocs and API summaries.
+    Clones the repository if it is not already available locally (tracked
+    repositories are reused without pulling), parses Java files, and indexes
+    APIs with rich context including javadocs and API summaries.
 
     Args:
         repository_url: Git repository URL (required)
@@ -322,56 +482,64 @@ def extract_apis(  # pylint: disable=too-many-locals
         class_filter=class_filter,
     )
 
-    context_builder = ContextBuilder()
+    # Reuse the server's repository manager; the repository is only cloned
+    # if it is not already available locally
+    repo_manager = _state.repository_manager
+    repo_manager.ensure_repository(request.repository_url)
 
-    # Initialize repository manager for this specific repo
-    repo_config = RepositoryConfig(
-        urls=[request.repository_url],
-        local_base_path="./repositories",
+    # Java files, filtered by package if specified; the listing is reused
+    # until the repository's HEAD moves
+    file_paths = repo_manager.get_java_files_cached(
+        request.repository_url, request.package_filter
     )
-    repo_manager = RepositoryManager(repo_config)
-
-    # Clone/update repository
-    repo_manager.initialize_repositories()
-
-    # Get Java files
-    java_files = repo_manager.get_java_files(request.repository_url)
-    logger.info("extract_apis: found %d Java files in repository", len(java_files))
-
-    # Filter by package if specified
-    if request.package_filter:
-        java_files = repo_manager.filter_java_files_by_package(
-            request.repository_url, request.package_filter
-        )
-
-    # Parse Java files
-    parser = JavaSourceParser()
     parsed_classes = []
+    # Counted while collecting, rather than in a second pass over the classes
+    total_methods = 0
+    file_count = len(file_paths)
+    # Case-insensitive substring match, folded by the regex engine in C
+    class_pattern = (
+        re.compile(re.escape(request.class_filter), re.IGNORECASE)
+        if request.class_filter
+        else None
+    )
 
-    for java_file in java_files:
+    if file_count >= PARALLEL_PARSE_MIN_FILES:
+        # Parsing is CPU bound, so large repositories are parsed across
+        # processes; indexing stays in this process
+        pool = _get_parse_pool()
         try:
-            java_class = parser.parse_file(str(java_file))
+            for java_class in pool.map(
+                partial(_parse_one, class_pattern=class_pattern),
+                file_paths,
+                chunksize=PARSE_CHUNK_SIZE,
+            ):
+                if java_class is not None:
+                    parsed_classes.append(java_class)
+                    total_methods += len(java_class.methods)
+        except BrokenProcessPool:
+            _discard_parse_pool(pool)
+            raise
+    else:
+        for _, java_class in _get_parser().parse_files(file_paths):
+            # Files that fail to parse are logged by the parser and skipped
+            if java_class is None:
+                continue
 
             # Filter by class name if specified
-            if request.class_filter:
-                if request.class_filter.lower() not in java_class.name.lower():
-                    continue
+            if class_pattern and not class_pattern.search(java_class.name):
+                continue
 
             parsed_classes.append(java_class)
+            total_methods += len(java_class.methods)
 
-            # Index the class
-            _state.indexer.add_class(java_class, request.repository_url)
-
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            # Log and skip files that fail to parse
-            logger.warning("Failed to parse file %s: %s", java_file, e)
-            continue
+    # Index the classes
+    _state.indexer.add_classes(parsed_classes, request.repository_url)
 
-    # Build context for response
-    for java_class in parsed_classes:
-        context_builder.build_class_context(java_class)
-
-    total_methods = sum(len(cls.methods) for cls in parsed_classes)
+    logger.info(
+        "extract_apis: parsed %d classes from %d Java files",
+        len(parsed_classes),
+        file_count,
+    )
 
     # Get the actual branch from repository metadata
     repo_metadata = repo_manager.get_repository_metadata(request.repository_url)
@@ -379,8 +547,11 @@ def extract_apis(  # pylint: disable=too-many-locals
         repo_metadata.branch if repo_metadata else (request.branch or "unknown")
     )
 
-    response = ExtractApisResponse(
-        classes=[cls.model_dump() for cls in parsed_classes],
+    # Pass parsed models through so they are serialized once, by the final
+    # model_dump() below, rather than dumped, re-validated and dumped again;
+    # model_construct also skips re-checking the already-validated classes
+    response = ExtractApisResponse.model_construct(
+        classes=parsed_classes,
         total_classes=len(parsed_classes),
         total_methods=total_methods,
         repository_url=request.repository_url,
@@ -397,7 +568,7 @@ def extract_apis(  # pylint: disable=too-many-locals
 
 
 # Tool: Generate Guide
-def generate_guide(  # pylint: disable=too-many-locals
+def generate_guide(
     use_case: str,
     repository_filter: Optional[str] = None,
     max_results: int = 10,
@@ -439,29 +610,11 @@ def generate_guide(  # pylint: disable=too-many-locals
         max_results=max_results,
     )
 
-    context_builder = ContextBuilder()
-
     # Simple keyword-based search in use case
-    keywords = _extract_keywords(request.use_case)
-
-    relevant_classes = []
-    relevant_methods = []
-
-    # Search for relevant classes and methods based on keywords
-    for keyword in keywords[: request.max_results]:
-        # Search methods by partial name
-        methods = _state.query_engine.search_methods_partial(
-            keyword, case_sensitive=False
-        )
-        relevant_methods.extend([m for c, m in methods[: request.max_results]])
-
-        # Search classes by name
-        classes = _state.query_engine.get_classes_by_name(keyword, case_sensitive=False)
-        relevant_classes.extend(classes[: request.max_results])
-
-    # Limit results
-    relevant_classes = relevant_classes[: request.max_results]
-    relevant_methods = relevant_methods[: request.max_results]
+    keywords = extract_keywords(request.use_case)
+    relevant_classes, relevant_methods = _state.query_engine.search_any(
+        keywords, request.max_results
+    )
 
     logger.info(
         "generate_guide: found %d relevant classes and %d relevant methods",
@@ -469,55 +622,22 @@ def generate_guide(  # pylint: disable=too-many-locals
         len(relevant_methods),
     )
 
-    # Build formatted guide
-    guide_lines = []
-    guide_lines.append(f"# API Usage Guide: {request.use_case}")
-    guide_lines.append("")
-
-    if relevant_classes:
-        guide_lines.append("## Relevant Classes")
-        guide_lines.append("")
-        for java_class in relevant_classes[:5]:
-            summary = context_builder.build_api_summary(java_class)
-            guide_lines.append(summary)
-            guide_lines.append("")
-
-    if relevant_methods:
-        guide_lines.append("## Relevant Methods")
-        guide_lines.append("")
-        guide_lines.append("Found relevant methods for the use case.")
-        guide_lines.append("")
-
-    guide = "\n".join(guide_lines)
-
-    response = GenerateGuideResponse(
-        guide=guide,
-        relevant_classes=[cls.model_dump() for cls in relevant_classes],
-        relevant_methods=[m.model_dump() for m in relevant_methods],
+    response = GenerateGuideResponse.model_construct(
+        guide=format_guide(
+            request.use_case,
+            relevant_classes,
+            relevant_methods,
+            _state.context_builder,
+        ),
+        relevant_classes=relevant_classes,
+        relevant_methods=relevant_methods,
         use_case=request.use_case,
     )
 
-    return response.model_dump()
-
-
-def _extract_keywords(use_case: str) -> list[str]:
-    """Extract keywords from use case description."""
-    words = use_case.lower().split()
-    common_words = {
-        "how",
-        "to",
-        "the",
-        "a",
-        "an",
-        "is",
-        "are",
-        "for",
-        "in",
-        "on",
-        "with",
-    }
-    keywords = [w for w in words if w not in common_words and len(w) > 2]
-    return keywords
+    result = response.model_dump(exclude={"relevant_classes", "relevant_methods"})
+    result["relevant_classes"] = [_dump_cached(cls) for cls in relevant_classes]
+    result["relevant_methods"] = [_dump_cached(m) for m in relevant_methods]
+    return result
 
 
 # Resource: Project Context
@@ -549,11 +669,19 @@ def get_project_context(repository_name: str) -> str:
         )
         return f'{{"error": "Repository not found: {repository_name}"}}'
 
+    # Project context only changes when the repository is re-indexed
+    generation = _state.indexer.generation
+    cached = _state.project_context_cache.get(metadata.url)
+    if cached and cached[0] == generation:
+        logger.debug("get_project_context cache hit for: %s", metadata.url)
+        return cached[1]
+
     # Build project context
     context_builder = ProjectContextBuilder(
         _state.repository_manager,
         _state.indexer,
         _state.query_engine,
+        _state.context_builder,
     )
 
     context = context_builder.build_project_context(metadata.url)
@@ -561,4 +689,6 @@ def get_project_context(repository_name: str) -> str:
     # Return as formatted response
     response = ProjectContextResponse(**context)
     logger.info("get_project_context completed for repository: %s", repository_name)
-    return response.model_dump_json(indent=2)
+    rendered = response.model_dump_json(indent=2)
+    _state.project_context_cache[metadata.url] = (generation, rendered)
+    return rendered
@@ -42,7 +42,6 @@ NOTE: This tool is now implemented as a FastMCP decorated function in server.py.
 This module is kept for backwards compatibility and testing purposes.
 """
 
-from javamcp.context.context_builder import ContextBuilder
 from javamcp.indexer.query_engine import QueryEngine
 from javamcp.models.mcp_protocol import AnalyzeClassRequest, AnalyzeClassResponse
 
@@ -66,8 +65,6 @@ def analyze_class_tool(
     Returns:
         AnalyzeClassResponse with complete class analysis and context
     """
-    context_builder = ContextBuilder()
-
     # Search for the class
     java_class = query_engine.search_class(request.fully_qualified_name)
 
@@ -75,17 +72,15 @@ def analyze_class_tool(
         return AnalyzeClassResponse(found=False, matches=0)
 
     # If repository filter specified, verify class is from that repository
-    if request.repository_name:
-        repo_classes = query_engine.filter_classes_by_repository(
-            request.repository_name
-        )
-        if java_class not in repo_classes:
-            return AnalyzeClassResponse(found=False, matches=0)
-
-    # Build rich context
-    context_builder.build_class_context(java_class, include_methods=True)
+    if request.repository_name and not query_engine.is_class_in_repository(
+        java_class, request.repository_name
+    ):
+        # Still reject repositories that are not indexed at all
+        query_engine.check_repository_indexed(request.repository_name)
+        return AnalyzeClassResponse(found=False, matches=0)
 
-    return AnalyzeClassResponse(
+    # Indexed models are already validated, so skip re-validation
+    return AnalyzeClassResponse.model_construct(
         java_class=java_class,
         found=True,
         matches=1,
@@ -42,8 +42,9 @@ NOTE: This tool is now implemented as a FastMCP decorated function in server.py.
 This module is kept for backwards compatibility and testing purposes.
 """
 
+import re
+
 from javamcp.config.schema import RepositoryConfig
-from javamcp.context.context_builder import ContextBuilder
 from javamcp.indexer.indexer import APIIndexer
 from javamcp.models.mcp_protocol import ExtractApisRequest, ExtractApisResponse
 from javamcp.parser.java_parser import JavaSourceParser
@@ -70,8 +71,6 @@ def extract_apis_tool(
     Returns:
         ExtractApisResponse with extracted classes and context
     """
-    context_builder = ContextBuilder()
-
     # Initialize repository manager
     repo_config = RepositoryConfig(
         urls=[request.repository_url],
@@ -82,29 +81,34 @@ def extract_apis_tool(
     # Clone/update repository
     repo_manager.initialize_repositories()
 
-    # Get Java files
-    java_files = repo_manager.get_java_files(request.repository_url)
-
-    # Filter by package if specified
+    # Stream Java files, filtered by package if specified
     if request.package_filter:
-        java_files = repo_manager.filter_java_files_by_package(
+        java_files = repo_manager.iter_java_files_by_package(
             request.repository_url, request.package_filter
         )
+    else:
+        java_files = repo_manager.iter_java_files(request.repository_url)
 
     # Parse Java files
     parser = JavaSourceParser()
     parsed_classes = []
+    total_methods = 0
+    class_pattern = (
+        re.compile(re.escape(request.class_filter), re.IGNORECASE)
+        if request.class_filter
+        else None
+    )
 
     for java_file in java_files:
         try:
             java_class = parser.parse_file(str(java_file))
 
             # Filter by class name if specified
-            if request.class_filter:
-                if request.class_filter.lower() not in java_class.name.lower():
-                    continue
+            if class_pattern and not class_pattern.search(java_class.name):
+                continue
 
             parsed_classes.append(java_class)
+            total_methods += len(java_class.methods)
 
             # Index the class
             indexer.add_class(java_class, request.repository_url)
@@ -113,12 +117,6 @@ def extract_apis_tool(
             # Skip files that fail to parse
             continue
 
-    # Build context for response
-    for java_class in parsed_classes:
-        context_builder.build_class_context(java_class)
-
-    total_methods = sum(len(cls.methods) for cls in parsed_classes)
-
     return ExtractApisResponse(
         classes=parsed_classes,
         total_classes=len(parsed_classes),
@@ -42,11 +42,26 @@ NOTE: This tool is now implemented as a FastMCP decorated function in server.py.
 This module is kept for backwards compatibility and testing purposes.
 """
 
-from javamcp.context.context_builder import ContextBuilder
+from javamcp.context.context_builder import get_context_builder
+from javamcp.context.guide_builder import (
+    extract_keywords,
+    format_guide,
+)
 from javamcp.indexer.query_engine import QueryEngine
 from javamcp.models.mcp_protocol import GenerateGuideRequest, GenerateGuideResponse
 
 
+def _extract_keywords(use_case: str) -> list[str]:
+    """
+    Extract keywords from use case description.
+
+    Kept for backwards compatibility; keyword extraction lives in
+    guide_builder. Returns a new list, so callers may modify it without
+    affecting the cached keywords.
+    """
+    return list(extract_keywords(use_case))
+
+
 def generate_guide_tool(
     request: GenerateGuideRequest, query_engine: QueryEngine
 ) -> GenerateGuideResponse:
@@ -66,74 +81,20 @@ def generate_guide_tool(
     Returns:
         GenerateGuideResponse with formatted usage guide and relevant APIs
     """
-    context_builder = ContextBuilder()
-
-    # Simple keyword-based search in use case
-    keywords = _extract_keywords(request.use_case)
-
-    relevant_classes = []
-    relevant_methods = []
-
-    # Search for relevant classes and methods based on keywords
-    for keyword in keywords[: request.max_results]:
-        # Search methods by partial name
-        methods = query_engine.search_methods_partial(keyword, case_sensitive=False)
-        relevant_methods.extend([m for c, m in methods[: request.max_results]])
-
-        # Search classes by name
-        classes = query_engine.get_classes_by_name(keyword, case_sensitive=False)
-        relevant_classes.extend(classes[: request.max_results])
-
-    # Limit results
-    relevant_classes = relevant_classes[: request.max_results]
-    relevant_methods = relevant_methods[: request.max_results]
-
-    # Build formatted guide
-    guide_lines = []
-    guide_lines.append(f"# API Usage Guide: {request.use_case}")
-    guide_lines.append("")
-
-    if relevant_classes:
-        guide_lines.append("## Relevant Classes")
-        guide_lines.append("")
-        for java_class in relevant_classes[:5]:
-            summary = context_builder.build_api_summary(java_class)
-            guide_lines.append(summary)
-            guide_lines.append("")
-
-    if relevant_methods:
-        guide_lines.append("## Relevant Methods")
-        guide_lines.append("")
-        # Group methods by class (simplified)
-        guide_lines.append("Found relevant methods for the use case.")
-        guide_lines.append("")
-
-    guide = "\n".join(guide_lines)
+    keywords = extract_keywords(request.use_case)
+    relevant_classes, relevant_methods = query_engine.search_any(
+        keywords, request.max_results
+    )
 
-    return GenerateGuideResponse(
-        guide=guide,
+    # Indexed models are already validated, so skip re-validation
+    return GenerateGuideResponse.model_construct(
+        guide=format_guide(
+            request.use_case,
+            relevant_classes,
+            relevant_methods,
+            get_context_builder(),
+        ),
         relevant_classes=relevant_classes,
         relevant_methods=relevant_methods,
         use_case=request.use_case,
     )
-
-
-def _extract_keywords(use_case: str) -> list[str]:
-    """Extract keywords from use case description."""
-    # Simple implementation: split and filter common words
-    words = use_case.lower().split()
-    common_words = {
-        "how",
-        "to",
-        "the",
-        "a",
-        "an",
-        "is",
-        "are",
-        "for",
-        "in",
-        "on",
-        "with",
-    }
-    keywords = [w for w in words if w not in common_words and len(w) > 2]
-    return keywords
@@ -42,7 +42,6 @@ NOTE: This tool is now implemented as a FastMCP decorated function in server.py.
 This module is kept for backwards compatibility and testing purposes.
 """
 
-from javamcp.context.context_builder import ContextBuilder
 from javamcp.indexer.query_engine import QueryEngine
 from javamcp.models.mcp_protocol import SearchMethodsRequest, SearchMethodsResponse
 
@@ -66,8 +65,6 @@ def search_methods_tool(
     Returns:
         SearchMethodsResponse with matching methods and full context
     """
-    context_builder = ContextBuilder()
-
     # Search for methods
     results = query_engine.search_methods(
         request.method_name,
@@ -75,14 +72,10 @@ def search_methods_tool(
         case_sensitive=request.case_sensitive,
     )
 
-    # Build rich context for each method
-    methods_with_context = []
-    for java_class, method in results:
-        # Add context to method
-        context_builder.build_method_context(method, java_class)
-        methods_with_context.append(method)
+    methods_with_context = [method for _, method in results]
 
-    return SearchMethodsResponse(
+    # Indexed models are already validated, so skip re-validation
+    return SearchMethodsResponse.model_construct(
         methods=methods_with_context,
         total_found=len(methods_with_context),
         query=request,
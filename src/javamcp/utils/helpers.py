@@ -40,10 +40,34 @@ Utility helper functions for JavaMCP server.
 """
 
 import re
+import sys
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
 
+# SSH repository URL, e.g. git@github.com:user/repo.git
+_GIT_SSH_PATTERN = r"git@[\w\.-]+:[\w\-]+/[\w\-]+\.git"
+
+# Valid repository URL: an SSH URL, or a plain HTTP(S) URL with a host and a
+# path; URLs with characters that need urlparse never match
+_GIT_URL_RE = re.compile(
+    rf"{_GIT_SSH_PATTERN}|(?i:https?)://[^/?#\[\]\t\r\n]+/[^?#\[\]\t\r\n]*"
+)
+
+# Owner and repository name of an SSH repository URL
+_SSH_EXTRACT_RE = re.compile(r":(.+)/(.+)\.git$")
+
+# Characters that need urlparse's full handling (query, fragment, IPv6 hosts
+# and the whitespace it strips) instead of the HTTP(S) fast path
+_URL_SPECIAL_CHARS = frozenset("?#[]\t\r\n")
+
+# Names at least this long are returned without interning, so unusual input
+# does not grow the interpreter's intern table
+MAX_INTERNED_NAME_LENGTH = 128
+
+# Characters a Git branch name cannot contain
+_INVALID_BRANCH_CHARS = frozenset("~^:?*[\\")
+
 
 def normalize_path(path: str) -> Path:
     """
@@ -58,17 +82,20 @@ def normalize_path(path: str) -> Path:
     return Path(path).expanduser().resolve()
 
 
-def is_java_file(path: Path) -> bool:
+def is_java_file(path: Path | str) -> bool:
     """
     Check if file is a Java source file.
 
     Args:
-        path: File path
+        path: File path, or file name as a string
 
     Returns:
-        True if file ends with .java
+        True if file ends with .java (case-insensitive)
     """
-    return path.suffix.lower() == ".java"
+    name = path if isinstance(path, str) else path.name
+    # Only the five suffix characters are lowercased; a bare ".java" is not
+    # a source file
+    return len(name) > 5 and name[-5:].lower() == ".java"
 
 
 def validate_java_file(path: Path) -> bool:
@@ -81,7 +108,8 @@ def validate_java_file(path: Path) -> bool:
     Returns:
         True if path exists and is a Java file
     """
-    return path.exists() and path.is_file() and is_java_file(path)
+    # The name check needs no filesystem access; is_file() implies exists()
+    return is_java_file(path) and path.is_file()
 
 
 def format_method_signature(
@@ -98,10 +126,17 @@ def format_method_signature(
     Returns:
         Formatted signature string
     """
-    params = ", ".join(f"{ptype} {pname}" for ptype, pname in parameters)
+    params = ", ".join([ptype + " " + pname for ptype, pname in parameters])
     return f"{return_type} {method_name}({params})"
 
 
+def _intern_name(name: str) -> str:
+    """Intern a short class or package name so repeated names share storage."""
+    if len(name) < MAX_INTERNED_NAME_LENGTH:
+        return sys.intern(name)
+    return name
+
+
 def format_class_name(fully_qualified_name: str) -> str:
     """
     Extract simple class name from fully-qualified name.
@@ -112,7 +147,7 @@ def format_class_name(fully_qualified_name: str) -> str:
     Returns:
         Simple class name
     """
-    return fully_qualified_name.split(".")[-1]
+    return _intern_name(fully_qualified_name.rpartition(".")[2])
 
 
 def get_package_name(fully_qualified_name: str) -> str:
@@ -125,10 +160,28 @@ def get_package_name(fully_qualified_name: str) -> str:
     Returns:
         Package name (empty string if no package)
     """
-    parts = fully_qualified_name.split(".")
-    if len(parts) > 1:
-        return ".".join(parts[:-1])
-    return ""
+    package, _, _ = fully_qualified_name.rpartition(".")
+    return _intern_name(package)
+
+
+def _split_http_url(url: str) -> Optional[tuple[str, str]]:
+    """
+    Split a plain HTTP(S) URL into host and path without urlparse.
+
+    Args:
+        url: Repository URL
+
+    Returns:
+        Tuple of (netloc, path), with the path keeping its leading "/", or
+        None if the URL is not a plain HTTP(S) URL and needs urlparse
+    """
+    scheme, separator, rest = url.partition("://")
+    if not separator or scheme.lower() not in ("http", "https"):
+        return None
+    if not _URL_SPECIAL_CHARS.isdisjoint(url):
+        return None
+    netloc, slash, path = rest.partition("/")
+    return netloc, slash + path
 
 
 def validate_repository_url(url: str) -> bool:
@@ -141,11 +194,14 @@ def validate_repository_url(url: str) -> bool:
     Returns:
         True if URL appears to be a valid Git repository URL
     """
-    # Basic validation - check if it's a valid URL or git URL
-    if url.startswith("git@"):
-        # SSH format: git@github.com:user/repo.git
-        return bool(re.match(r"^git@[\w\.-]+:[\w\-]+/[\w\-]+\.git$", url))
+    # SSH and plain HTTP(S) URLs are settled by a single regex match
+    if _GIT_URL_RE.fullmatch(url):
+        return True
+    if url.startswith("git@") or (url[:1] > " " and _URL_SPECIAL_CHARS.isdisjoint(url)):
+        return False
 
+    # Queries, fragments, IPv6 hosts and leading whitespace need full URL
+    # parsing
     try:
         result = urlparse(url)
         # Check if scheme is http/https and has netloc
@@ -167,15 +223,12 @@ def validate_branch_name(branch: str) -> bool:
     Returns:
         True if branch name is valid
     """
-    if not branch or not isinstance(branch, str):
+    if not branch:
         return False
 
-    # Branch name cannot contain: .., ~, ^, :, ?, *, [, \, space at beginning/end
-    invalid_patterns = [r"\.\.", "~", r"\^", ":", r"\?", r"\*", r"\[", "\\\\"]
-
-    for pattern in invalid_patterns:
-        if re.search(pattern, branch):
-            return False
+    # Branch name cannot contain: .., ~, ^, :, ?, *, [, \
+    if ".." in branch or not _INVALID_BRANCH_CHARS.isdisjoint(branch):
+        return False
 
     # Cannot start/end with slash, dot, or space
     if branch.startswith(("/", ".", " ")) or branch.endswith(("/", ".", " ")):
@@ -196,17 +249,20 @@ def extract_repository_name(url: str) -> Optional[str]:
     """
     if url.startswith("git@"):
         # SSH format: git@github.com:user/repo.git
-        match = re.search(r":(.+)/(.+)\.git$", url)
+        match = _SSH_EXTRACT_RE.search(url)
         if match:
             return match.group(2)
         return None
 
+    parts = _split_http_url(url)
+    if parts is not None:
+        path = parts[1].rstrip("/").removesuffix(".git")
+        return path.rpartition("/")[2] or None
+
     try:
         result = urlparse(url)
-        path = result.path.rstrip("/")
-        if path.endswith(".git"):
-            path = path[:-4]
-        return path.split("/")[-1]
+        path = result.path.rstrip("/").removesuffix(".git")
+        return path.rpartition("/")[2] or None
     except Exception:  # pylint: disable=broad-exception-caught
         return None
 
@@ -222,12 +278,11 @@ def format_list(items: list[str], max_items: int = 5) -> str:
     Returns:
         Formatted string
     """
-    if not items:
+    count = len(items)
+    if not count:
         return "none"
 
-    if len(items) <= max_items:
+    if count <= max_items:
         return ", ".join(items)
 
-    shown = items[:max_items]
-    remaining = len(items) - max_items
-    return f"{', '.join(shown)} (and {remaining} more)"
+    return f"{', '.join(items[:max_items])} (and {count - max_items} more)"
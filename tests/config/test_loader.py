@@ -40,8 +40,6 @@ Unit tests for configuration loader.
 """
 
 import json
-import tempfile
-from pathlib import Path
 
 import pytest
 
@@ -49,6 +47,18 @@ from javamcp.config.loader import ConfigurationError, load_config
 from javamcp.config.schema import ApplicationConfig, ServerMode
 
 
+@pytest.fixture
+def write_config(tmp_path):
+    """Write configuration content to a file in tmp_path and return its path."""
+
+    def _write(content: str, suffix: str) -> str:
+        config_file = tmp_path / f"config{suffix}"
+        config_file.write_text(content, encoding="utf-8")
+        return str(config_file)
+
+    return _write
+
+
 class TestLoadConfig:
     """Tests for configuration loading."""
 
@@ -63,158 +73,137 @@ class TestLoadConfig:
         with pytest.raises(ConfigurationError, match="Configuration file not found"):
             load_config("/nonexistent/config.yml")
 
-    def test_load_config_directory_fails(self):
+    def test_load_config_directory_fails(self, tmp_path):
         """Test that loading directory raises error."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with pytest.raises(ConfigurationError, match="not a file"):
-                load_config(tmpdir)
+        with pytest.raises(ConfigurationError, match="not a file"):
+            load_config(str(tmp_path))
 
-    def test_load_config_unsupported_format_fails(self):
+    def test_load_config_unsupported_format_fails(self, write_config):
         """Test that unsupported file format raises error."""
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as tmp:
-            tmp.write(b"some content")
-            tmp_path = tmp.name
+        config_path = write_config("some content", ".txt")
 
-        try:
-            with pytest.raises(
-                ConfigurationError, match="Unsupported configuration file format"
-            ):
-                load_config(tmp_path)
-        finally:
-            Path(tmp_path).unlink()
+        with pytest.raises(
+            ConfigurationError, match="Unsupported configuration file format"
+        ):
+            load_config(config_path)
 
 
-class TestLoadJsonConfig:
-    """Tests for JSON configuration loading."""
+_VALID_YAML_CONFIG = """
+server:
+  mode: http
+  port: 8080
+repositories:
+  urls:
+    - https://github.com/example/repo.git
+  local_base_path: /tmp/repos
+logging:
+  level: INFO
+  output: stderr
+"""
 
-    def test_load_valid_json_config(self):
-        """Test loading valid JSON configuration."""
-        config_data = {
-            "server": {"mode": "http", "port": 9000},
-            "repositories": {
-                "urls": ["https://github.com/example/repo.git"],
-                "local_base_path": "/tmp/repos",
-            },
-            "logging": {"level": "DEBUG", "output": "stderr"},
-        }
+_VALID_JSON_CONFIG = json.dumps(
+    {
+        "server": {"mode": "http", "port": 9000},
+        "repositories": {
+            "urls": ["https://github.com/example/repo.git"],
+            "local_base_path": "/tmp/repos",
+        },
+        "logging": {"level": "DEBUG", "output": "stderr"},
+    }
+)
+
+
+class TestLoadValidConfig:
+    """Tests for loading valid configuration in each supported format."""
+
+    @pytest.mark.parametrize(
+        "suffix,content,expected_mode,expected_port,expected_urls",
+        [
+            (".json", _VALID_JSON_CONFIG, ServerMode.HTTP, 9000, 1),
+            (".yaml", _VALID_YAML_CONFIG, ServerMode.HTTP, 8080, 1),
+            (".yml", "server:\n  mode: stdio\n", ServerMode.STDIO, 8000, 0),
+            (".YAML", _VALID_YAML_CONFIG, ServerMode.HTTP, 8080, 1),
+        ],
+    )
+    def test_load_valid_config(
+        self,
+        write_config,
+        suffix,
+        content,
+        expected_mode,
+        expected_port,
+        expected_urls,
+    ):
+        """Test loading valid configuration by file suffix."""
+        config = load_config(write_config(content, suffix))
+
+        assert config.server.mode == expected_mode
+        assert config.server.port == expected_port
+        assert len(config.repositories.urls) == expected_urls
+
+    def test_load_json_logging_level(self, write_config):
+        """Test logging settings are read from JSON configuration."""
+        config = load_config(write_config(_VALID_JSON_CONFIG, ".json"))
+
+        assert config.logging.level == "DEBUG"
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
-            json.dump(config_data, tmp)
-            tmp_path = tmp.name
 
-        try:
-            config = load_config(tmp_path)
-            assert config.server.mode == ServerMode.HTTP
-            assert config.server.port == 9000
-            assert len(config.repositories.urls) == 1
-            assert config.logging.level == "DEBUG"
-        finally:
-            Path(tmp_path).unlink()
+class TestLoadJsonConfig:
+    """Tests for JSON configuration loading."""
 
-    def test_load_invalid_json_fails(self):
+    def test_load_invalid_json_fails(self, write_config):
         """Test loading invalid JSON raises error."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
-            tmp.write("{ invalid json }")
-            tmp_path = tmp.name
+        config_path = write_config("{ invalid json }", ".json")
 
-        try:
-            with pytest.raises(ConfigurationError, match="Failed to parse JSON"):
-                load_config(tmp_path)
-        finally:
-            Path(tmp_path).unlink()
+        with pytest.raises(ConfigurationError, match="Failed to parse JSON"):
+            load_config(config_path)
 
-    def test_load_json_validation_fails(self):
+    def test_load_json_validation_fails(self, write_config):
         """Test loading JSON with invalid values fails validation."""
         config_data = {
             "server": {"port": 99999},  # Invalid port
         }
+        config_path = write_config(json.dumps(config_data), ".json")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
-            json.dump(config_data, tmp)
-            tmp_path = tmp.name
-
-        try:
-            with pytest.raises(
-                ConfigurationError, match="Configuration validation failed"
-            ):
-                load_config(tmp_path)
-        finally:
-            Path(tmp_path).unlink()
+        with pytest.raises(ConfigurationError, match="Configuration validation failed"):
+            load_config(config_path)
 
 
 class TestLoadYamlConfig:
     """Tests for YAML configuration loading."""
 
-    def test_load_valid_yaml_config(self):
-        """Test loading valid YAML configuration."""
-        yaml_content = """
+    def test_load_invalid_yaml_fails(self, write_config):
+        """Test loading invalid YAML raises error."""
+        invalid_yaml = """
 server:
   mode: http
-  port: 8080
-repositories:
-  urls:
-    - https://github.com/example/repo.git
-  local_base_path: /tmp/repos
-logging:
-  level: INFO
-  output: stderr
+  invalid indentation
 """
+        config_path = write_config(invalid_yaml, ".yaml")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as tmp:
-            tmp.write(yaml_content)
-            tmp_path = tmp.name
-
-        try:
-            config = load_config(tmp_path)
-            assert config.server.mode == ServerMode.HTTP
-            assert config.server.port == 8080
-            assert len(config.repositories.urls) == 1
-        finally:
-            Path(tmp_path).unlink()
-
-    def test_load_yml_extension(self):
-        """Test loading YAML file with .yml extension."""
-        yaml_content = """
-server:
-  mode: stdio
-"""
+        with pytest.raises(ConfigurationError, match="Failed to parse YAML"):
+            load_config(config_path)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as tmp:
-            tmp.write(yaml_content)
-            tmp_path = tmp.name
+    def test_yaml_loader_is_safe(self):
+        """Test YAML is parsed with a safe loader, libyaml-backed if present."""
+        import yaml
 
-        try:
-            config = load_config(tmp_path)
-            assert config.server.mode == ServerMode.STDIO
-        finally:
-            Path(tmp_path).unlink()
+        from javamcp.config import loader
 
-    def test_load_invalid_yaml_fails(self):
-        """Test loading invalid YAML raises error."""
-        invalid_yaml = """
-server:
-  mode: http
-  invalid indentation
-"""
+        expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+        assert loader._YamlLoader is expected
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as tmp:
-            tmp.write(invalid_yaml)
-            tmp_path = tmp.name
+    def test_load_yaml_rejects_python_tags(self, write_config):
+        """Test arbitrary Python object tags are not constructed."""
+        config_path = write_config(
+            "server: !!python/object/apply:os.getcwd []", ".yaml"
+        )
 
-        try:
-            with pytest.raises(ConfigurationError, match="Failed to parse YAML"):
-                load_config(tmp_path)
-        finally:
-            Path(tmp_path).unlink()
+        with pytest.raises(ConfigurationError, match="Failed to parse YAML"):
+            load_config(config_path)
 
-    def test_load_empty_yaml_returns_defaults(self):
+    def test_load_empty_yaml_returns_defaults(self, write_config):
         """Test loading empty YAML file returns default config."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as tmp:
-            tmp.write("")
-            tmp_path = tmp.name
-
-        try:
-            config = load_config(tmp_path)
-            assert isinstance(config, ApplicationConfig)
-        finally:
-            Path(tmp_path).unlink()
+        config = load_config(write_config("", ".yaml"))
+
+        assert isinstance(config, ApplicationConfig)
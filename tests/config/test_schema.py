@@ -314,18 +314,24 @@ class TestApplicationConfig:
 
     def test_validate_logging_file_path_file_output(self):
         """Test validation fails when file output without file_path."""
-        config = ApplicationConfig(logging=LoggingConfig(output="file"))
+        config = ApplicationConfig.model_construct(
+            logging=LoggingConfig.model_construct(output="file")
+        )
         with pytest.raises(ValueError, match="file_path must be specified"):
             config.validate_logging_file_path()
 
     def test_validate_logging_file_path_both_output(self):
         """Test validation fails when both output without file_path."""
-        config = ApplicationConfig(logging=LoggingConfig(output="both"))
+        config = ApplicationConfig.model_construct(
+            logging=LoggingConfig.model_construct(output="both")
+        )
         with pytest.raises(ValueError, match="file_path must be specified"):
             config.validate_logging_file_path()
 
     def test_validate_logging_file_path_stderr_output(self):
         """Test validation passes when stderr output without file_path."""
-        config = ApplicationConfig(logging=LoggingConfig(output="stderr"))
+        config = ApplicationConfig.model_construct(
+            logging=LoggingConfig.model_construct(output="stderr")
+        )
         # Should not raise
         config.validate_logging_file_path()
@@ -39,7 +39,9 @@
 Unit tests for ContextBuilder.
 """
 
-from javamcp.context.context_builder import ContextBuilder
+import pytest
+
+from javamcp.context.context_builder import ContextBuilder, get_context_builder
 from javamcp.models.java_entities import (
     JavaAnnotation,
     JavaClass,
@@ -50,127 +52,66 @@ from javamcp.models.java_entities import (
 )
 
 
-class TestContextBuilder:
-    """Tests for ContextBuilder class."""
-
-    def test_build_class_context(self):
-        """Test building class context."""
-        builder = ContextBuilder()
-
-        javadoc = JavaDoc(
-            summary="Test class for examples", description="Detailed description"
-        )
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-            javadoc=javadoc,
-        )
+@pytest.fixture(scope="module")
+def builder():
+    """Shared ContextBuilder; its contexts are only read by these tests."""
+    return ContextBuilder()
 
-        context = builder.build_class_context(java_class)
 
-        assert context["name"] == "TestClass"
-        assert context["fully_qualified_name"] == "com.example.TestClass"
-        assert context["package"] == "com.example"
-        assert context["summary"] == "Test class for examples"
+@pytest.fixture(scope="module")
+def plain_class():
+    """Plain class without members, shared by tests that only read it."""
+    return JavaClass(
+        name="TestClass",
+        fully_qualified_name="com.example.TestClass",
+        package="com.example",
+    )
 
-    def test_build_class_context_with_annotations(self):
-        """Test building class context with annotations."""
-        builder = ContextBuilder()
 
-        annotation = JavaAnnotation(name="Service", attributes={"value": "testService"})
-        java_class = JavaClass(
-            name="ServiceClass",
-            fully_qualified_name="com.example.ServiceClass",
-            package="com.example",
-            annotations=[annotation],
-        )
-
-        context = builder.build_class_context(java_class)
-
-        assert context["annotations"] == ["Service"]
-
-    def test_build_class_context_with_inheritance(self):
-        """Test building class context with inheritance info."""
-        builder = ContextBuilder()
+class TestContextBuilder:
+    """Tests for ContextBuilder class."""
 
+    def test_build_class_context_matrix(self, builder):
+        """Test class context keys with and without member details."""
         java_class = JavaClass(
             name="ChildClass",
             fully_qualified_name="com.example.ChildClass",
             package="com.example",
+            javadoc=JavaDoc(
+                summary="Test class for examples", description="Detailed description"
+            ),
+            annotations=[
+                JavaAnnotation(name="Service", attributes={"value": "testService"})
+            ],
             extends="com.example.ParentClass",
             implements=["Serializable", "Comparable"],
+            methods=[JavaMethod(name="testMethod", return_type="void", parameters=[])],
+            fields=[JavaField(name="testField", type="String", modifiers=["private"])],
         )
 
-        context = builder.build_class_context(java_class)
+        context = builder.build_class_context(java_class, include_methods=True)
 
+        assert context["name"] == "ChildClass"
+        assert context["fully_qualified_name"] == "com.example.ChildClass"
+        assert context["package"] == "com.example"
+        assert context["summary"] == "Test class for examples"
+        assert context["annotations"] == ["Service"]
         assert context["inheritance"]["extends"] == "com.example.ParentClass"
         assert context["inheritance"]["implements"] == ["Serializable", "Comparable"]
-
-    def test_build_class_context_with_methods(self):
-        """Test building class context with methods."""
-        builder = ContextBuilder()
-
-        method = JavaMethod(
-            name="testMethod",
-            return_type="void",
-            parameters=[],
-        )
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-            methods=[method],
-        )
-
-        context = builder.build_class_context(java_class, include_methods=True)
-
         assert len(context["methods"]) == 1
         assert context["methods"][0]["name"] == "testMethod"
-
-    def test_build_class_context_with_fields(self):
-        """Test building class context with fields."""
-        builder = ContextBuilder()
-
-        field = JavaField(
-            name="testField",
-            type="String",
-            modifiers=["private"],
-        )
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-            fields=[field],
-        )
-
-        context = builder.build_class_context(java_class, include_methods=True)
-
         assert len(context["fields"]) == 1
         assert context["fields"][0]["name"] == "testField"
         assert context["fields"][0]["type"] == "String"
 
-    def test_build_class_context_without_methods(self):
-        """Test building class context without methods."""
-        builder = ContextBuilder()
-
-        method = JavaMethod(name="testMethod", return_type="void", parameters=[])
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-            methods=[method],
-        )
-
         context = builder.build_class_context(java_class, include_methods=False)
 
+        assert context["name"] == "ChildClass"
         assert "methods" not in context
         assert "fields" not in context
 
-    def test_build_method_context(self):
+    def test_build_method_context(self, builder):
         """Test building method context."""
-        builder = ContextBuilder()
-
         javadoc = JavaDoc(
             summary="Calculates sum",
             params={"a": "First number", "b": "Second number"},
@@ -193,109 +134,65 @@ class TestContextBuilder:
         assert context["summary"] == "Calculates sum"
         assert context["return_description"] == "Sum of a and b"
 
-    def test_build_method_context_with_containing_class(self):
+    def test_build_method_context_with_containing_class(self, builder, plain_class):
         """Test building method context with containing class."""
-        builder = ContextBuilder()
-
         method = JavaMethod(name="testMethod", return_type="void", parameters=[])
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-        )
 
-        context = builder.build_method_context(method, containing_class=java_class)
+        context = builder.build_method_context(method, containing_class=plain_class)
 
         assert context["class_name"] == "TestClass"
         assert context["class_fqn"] == "com.example.TestClass"
 
-    def test_build_method_context_with_throws(self):
-        """Test building method context with throws clause."""
-        builder = ContextBuilder()
-
-        method = JavaMethod(
-            name="riskyMethod",
-            return_type="void",
-            parameters=[],
-            throws=["IOException", "SQLException"],
-        )
-
-        context = builder.build_method_context(method)
-
-        assert context["throws"] == ["IOException", "SQLException"]
-
-    def test_build_method_context_with_annotations(self):
-        """Test building method context with annotations."""
-        builder = ContextBuilder()
-
-        annotation = JavaAnnotation(name="Override")
+    @pytest.mark.parametrize(
+        "method_kwargs,key,expected",
+        [
+            (
+                {"throws": ["IOException", "SQLException"]},
+                "throws",
+                ["IOException", "SQLException"],
+            ),
+            (
+                {"annotations": [JavaAnnotation(name="Override")]},
+                "annotations",
+                ["Override"],
+            ),
+            ({"is_constructor": True, "return_type": ""}, "is_constructor", True),
+        ],
+    )
+    def test_build_method_context_details(self, builder, method_kwargs, key, expected):
+        """Test throws clauses, annotations and constructors in method context."""
         method = JavaMethod(
-            name="toString",
-            return_type="String",
-            parameters=[],
-            annotations=[annotation],
+            **{"name": "sample", "return_type": "void", **method_kwargs}
         )
 
         context = builder.build_method_context(method)
 
-        assert context["annotations"] == ["Override"]
+        assert context[key] == expected
 
-    def test_build_method_context_constructor(self):
-        """Test building method context for constructor."""
-        builder = ContextBuilder()
-
-        method = JavaMethod(
-            name="TestClass",
-            return_type="",
-            parameters=[],
-            is_constructor=True,
-        )
-
-        context = builder.build_method_context(method)
-
-        assert context["is_constructor"] is True
-
-    def test_build_api_summary(self):
+    def test_build_api_summary(self, builder, plain_class):
         """Test building API summary."""
-        builder = ContextBuilder()
-
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-        )
-
-        summary = builder.build_api_summary(java_class)
+        summary = builder.build_api_summary(plain_class)
 
         assert isinstance(summary, str)
         assert "TestClass" in summary
 
-    def test_build_method_summary(self):
+    def test_build_method_summary(self, builder, plain_class):
         """Test building method summary."""
-        builder = ContextBuilder()
-
         method = JavaMethod(name="testMethod", return_type="void", parameters=[])
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-        )
 
-        summary = builder.build_method_summary(method, java_class)
+        summary = builder.build_method_summary(method, plain_class)
 
         assert isinstance(summary, str)
         assert "testMethod" in summary
 
-    def test_aggregate_class_contexts(self):
+    def test_aggregate_class_contexts(self, builder, make_class):
         """Test aggregating contexts for multiple classes."""
-        builder = ContextBuilder()
-
-        class1 = JavaClass(
+        class1 = make_class(
             name="Class1",
             fully_qualified_name="com.example.Class1",
             package="com.example",
         )
-        class2 = JavaClass(
+        class2 = make_class(
             name="Class2",
             fully_qualified_name="com.example.Class2",
             package="com.example",
@@ -307,69 +204,30 @@ class TestContextBuilder:
         assert contexts[0]["name"] == "Class1"
         assert contexts[1]["name"] == "Class2"
 
-    def test_get_class_type_interface(self):
-        """Test class type determination for interface."""
-        builder = ContextBuilder()
-
-        java_class = JavaClass(
-            name="TestInterface",
-            fully_qualified_name="com.example.TestInterface",
-            package="com.example",
-            is_interface=True,
-        )
-
-        context = builder.build_class_context(java_class)
-
-        assert context["type"] == "interface"
-
-    def test_get_class_type_enum(self):
-        """Test class type determination for enum."""
-        builder = ContextBuilder()
-
-        java_class = JavaClass(
-            name="TestEnum",
-            fully_qualified_name="com.example.TestEnum",
+    @pytest.mark.parametrize(
+        "flags,expected",
+        [
+            ({"is_interface": True}, "interface"),
+            ({"is_enum": True}, "enum"),
+            ({"is_abstract": True}, "abstract class"),
+            ({}, "class"),
+        ],
+    )
+    def test_get_class_type(self, builder, make_class, flags, expected):
+        """Test class type determination from the class flags."""
+        java_class = make_class(
+            name="SampleType",
+            fully_qualified_name="com.example.SampleType",
             package="com.example",
-            is_enum=True,
+            **flags,
         )
 
         context = builder.build_class_context(java_class)
 
-        assert context["type"] == "enum"
-
-    def test_get_class_type_abstract(self):
-        """Test class type determination for abstract class."""
-        builder = ContextBuilder()
-
-        java_class = JavaClass(
-            name="AbstractClass",
-            fully_qualified_name="com.example.AbstractClass",
-            package="com.example",
-            is_abstract=True,
-        )
-
-        context = builder.build_class_context(java_class)
+        assert context["type"] == expected
 
-        assert context["type"] == "abstract class"
-
-    def test_get_class_type_regular(self):
-        """Test class type determination for regular class."""
-        builder = ContextBuilder()
-
-        java_class = JavaClass(
-            name="RegularClass",
-            fully_qualified_name="com.example.RegularClass",
-            package="com.example",
-        )
-
-        context = builder.build_class_context(java_class)
-
-        assert context["type"] == "class"
-
-    def test_format_javadoc_with_all_fields(self):
+    def test_format_javadoc_with_all_fields(self, builder):
         """Test Javadoc formatting with all fields."""
-        builder = ContextBuilder()
-
         javadoc = JavaDoc(
             summary="Test summary",
             description="Test description",
@@ -398,11 +256,9 @@ class TestContextBuilder:
         assert context["javadoc"]["returns"] == "Return value"
         assert context["javadoc"]["deprecated"] == "Use newMethod instead"
 
-    def test_format_javadoc_none(self):
+    def test_format_javadoc_none(self, builder, make_class):
         """Test Javadoc formatting with None."""
-        builder = ContextBuilder()
-
-        java_class = JavaClass(
+        java_class = make_class(
             name="TestClass",
             fully_qualified_name="com.example.TestClass",
             package="com.example",
@@ -413,10 +269,8 @@ class TestContextBuilder:
 
         assert context["javadoc"] is None
 
-    def test_get_param_description_exists(self):
+    def test_get_param_description_exists(self, builder):
         """Test getting parameter description when it exists."""
-        builder = ContextBuilder()
-
         javadoc = JavaDoc(
             summary="Test method",
             params={"param1": "First parameter"},
@@ -433,10 +287,8 @@ class TestContextBuilder:
 
         assert context["parameters"][0]["description"] == "First parameter"
 
-    def test_get_param_description_not_exists(self):
+    def test_get_param_description_not_exists(self, builder):
         """Test getting parameter description when it doesn't exist."""
-        builder = ContextBuilder()
-
         param = JavaParameter(name="param1", type="String")
         method = JavaMethod(
             name="testMethod",
@@ -448,10 +300,8 @@ class TestContextBuilder:
 
         assert context["parameters"][0]["description"] == ""
 
-    def test_build_field_context_with_javadoc(self):
+    def test_build_field_context_with_javadoc(self, builder):
         """Test building field context with javadoc."""
-        builder = ContextBuilder()
-
         javadoc = JavaDoc(summary="Test field")
         field = JavaField(
             name="testField",
@@ -469,3 +319,10 @@ class TestContextBuilder:
         context = builder.build_class_context(java_class, include_methods=True)
 
         assert context["fields"][0]["javadoc"]["summary"] == "Test field"
+
+    def test_get_context_builder_shared(self):
+        """Test the shared builder is created once and reused."""
+        builder = get_context_builder()
+
+        assert isinstance(builder, ContextBuilder)
+        assert get_context_builder() is builder
@@ -39,6 +39,8 @@
 Unit tests for context formatters.
 """
 
+import pytest
+
 from javamcp.context.formatter import (
     format_class_context,
     format_class_hierarchy,
@@ -58,177 +60,235 @@ from javamcp.models.java_entities import (
 class TestFormatClassContext:
     """Tests for format_class_context function."""
 
-    def test_format_basic_class(self):
-        """Test formatting basic class without methods."""
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-        )
-
-        result = format_class_context(java_class)
-
-        assert "# com.example.TestClass" in result
-        assert "**Type:** Class" in result
-        assert "**Package:** com.example" in result
-
-    def test_format_class_with_javadoc(self):
-        """Test formatting class with javadoc."""
-        javadoc = JavaDoc(
-            summary="Test class summary",
-            description="Detailed description of test class",
-        )
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-            javadoc=javadoc,
-        )
-
-        result = format_class_context(java_class)
-
-        assert "**Summary:** Test class summary" in result
-        assert "**Description:**" in result
-        assert "Detailed description of test class" in result
-
-    def test_format_class_with_modifiers(self):
-        """Test formatting class with modifiers."""
+    @pytest.mark.parametrize(
+        "class_kwargs,expected",
+        [
+            (
+                {},
+                [
+                    "# com.example.TestClass",
+                    "**Type:** Class",
+                    "**Package:** com.example",
+                ],
+            ),
+            (
+                {
+                    "javadoc": JavaDoc(
+                        summary="Test class summary",
+                        description="Detailed description of test class",
+                    )
+                },
+                [
+                    "**Summary:** Test class summary",
+                    "**Description:**",
+                    "Detailed description of test class",
+                ],
+            ),
+            ({"modifiers": ["public", "final"]}, ["**Modifiers:** public, final"]),
+            (
+                {
+                    "annotations": [
+                        JavaAnnotation(
+                            name="Service", attributes={"value": "testService"}
+                        )
+                    ]
+                },
+                ["**Annotations:** Service"],
+            ),
+            (
+                {
+                    "extends": "ParentClass",
+                    "implements": ["Serializable", "Comparable"],
+                },
+                [
+                    "**Extends:** ParentClass",
+                    "**Implements:** Serializable, Comparable",
+                ],
+            ),
+            (
+                {
+                    "methods": [
+                        JavaMethod(
+                            name="testMethod",
+                            return_type="void",
+                            parameters=[],
+                            signature="void testMethod()",
+                            javadoc=JavaDoc(summary="Test method"),
+                        )
+                    ]
+                },
+                [
+                    "## Methods",
+                    "### testMethod",
+                    "**Signature:** `void testMethod()`",
+                    "**Summary:** Test method",
+                ],
+            ),
+            (
+                {
+                    "fields": [
+                        JavaField(
+                            name="testField",
+                            type="String",
+                            modifiers=["private"],
+                            javadoc=JavaDoc(summary="Test field"),
+                        )
+                    ]
+                },
+                ["## Fields", "- `String testField`", "- Test field"],
+            ),
+            ({"is_interface": True}, ["**Type:** Interface"]),
+            ({"is_enum": True}, ["**Type:** Enum"]),
+            ({"is_abstract": True}, ["**Type:** Abstract Class"]),
+        ],
+        ids=[
+            "basic",
+            "javadoc",
+            "modifiers",
+            "annotations",
+            "inheritance",
+            "methods",
+            "fields",
+            "interface",
+            "enum",
+            "abstract",
+        ],
+    )
+    def test_format_class_context(self, class_kwargs, expected):
+        """Test formatted class context contains each expected section."""
         java_class = JavaClass(
             name="TestClass",
             fully_qualified_name="com.example.TestClass",
             package="com.example",
-            modifiers=["public", "final"],
+            **class_kwargs,
         )
 
         result = format_class_context(java_class)
 
-        assert "**Modifiers:** public, final" in result
-
-    def test_format_class_with_annotations(self):
-        """Test formatting class with annotations."""
-        annotation = JavaAnnotation(name="Service", attributes={"value": "testService"})
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-            annotations=[annotation],
-        )
-
-        result = format_class_context(java_class)
-
-        assert "**Annotations:** Service" in result
-
-    def test_format_class_with_inheritance(self):
-        """Test formatting class with inheritance."""
-        java_class = JavaClass(
-            name="ChildClass",
-            fully_qualified_name="com.example.ChildClass",
-            package="com.example",
-            extends="ParentClass",
-            implements=["Serializable", "Comparable"],
-        )
-
-        result = format_class_context(java_class)
-
-        assert "**Extends:** ParentClass" in result
-        assert "**Implements:** Serializable, Comparable" in result
-
-    def test_format_class_with_methods(self):
-        """Test formatting class with methods."""
-        javadoc = JavaDoc(summary="Test method")
-        method = JavaMethod(
-            name="testMethod",
-            return_type="void",
-            parameters=[],
-            signature="void testMethod()",
-            javadoc=javadoc,
-        )
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-            methods=[method],
-        )
-
-        result = format_class_context(java_class)
-
-        assert "## Methods" in result
-        assert "### testMethod" in result
-        assert "**Signature:** `void testMethod()`" in result
-        assert "**Summary:** Test method" in result
-
-    def test_format_class_with_fields(self):
-        """Test formatting class with fields."""
-        javadoc = JavaDoc(summary="Test field")
-        field = JavaField(
-            name="testField",
-            type="String",
-            modifiers=["private"],
-            javadoc=javadoc,
-        )
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-            fields=[field],
-        )
-
-        result = format_class_context(java_class)
-
-        assert "## Fields" in result
-        assert "- `String testField`" in result
-        assert "- Test field" in result
-
-    def test_format_interface(self):
-        """Test formatting interface."""
-        java_class = JavaClass(
-            name="TestInterface",
-            fully_qualified_name="com.example.TestInterface",
-            package="com.example",
-            is_interface=True,
-        )
-
-        result = format_class_context(java_class)
-
-        assert "**Type:** Interface" in result
-
-    def test_format_enum(self):
-        """Test formatting enum."""
-        java_class = JavaClass(
-            name="TestEnum",
-            fully_qualified_name="com.example.TestEnum",
-            package="com.example",
-            is_enum=True,
-        )
-
-        result = format_class_context(java_class)
-
-        assert "**Type:** Enum" in result
-
-    def test_format_abstract_class(self):
-        """Test formatting abstract class."""
-        java_class = JavaClass(
-            name="AbstractClass",
-            fully_qualified_name="com.example.AbstractClass",
-            package="com.example",
-            is_abstract=True,
-        )
-
-        result = format_class_context(java_class)
-
-        assert "**Type:** Abstract Class" in result
+        for text in expected:
+            assert text in result
 
 
 class TestFormatMethodContext:
     """Tests for format_method_context function."""
 
-    def test_format_basic_method(self):
-        """Test formatting basic method."""
+    @pytest.mark.parametrize(
+        "method_kwargs,expected",
+        [
+            (
+                {},
+                [
+                    "# com.example.TestClass.testMethod",
+                    "**Signature:** `void testMethod()`",
+                ],
+            ),
+            (
+                {
+                    "javadoc": JavaDoc(
+                        summary="Test method summary",
+                        description="Detailed method description",
+                    )
+                },
+                [
+                    "**Summary:** Test method summary",
+                    "**Description:**",
+                    "Detailed method description",
+                ],
+            ),
+            (
+                {
+                    "parameters": [
+                        JavaParameter(name="param1", type="String"),
+                        JavaParameter(name="param2", type="int"),
+                    ],
+                    "signature": "public void testMethod(String param1, int param2)",
+                    "javadoc": JavaDoc(
+                        summary="Test method",
+                        params={
+                            "param1": "First parameter",
+                            "param2": "Second parameter",
+                        },
+                    ),
+                },
+                [
+                    "**Parameters:**",
+                    "- `param1`: First parameter",
+                    "- `param2`: Second parameter",
+                ],
+            ),
+            (
+                {
+                    "return_type": "int",
+                    "signature": "public int testMethod()",
+                    "javadoc": JavaDoc(
+                        summary="Test method", returns="The result value"
+                    ),
+                },
+                ["**Returns:** The result value"],
+            ),
+            (
+                {
+                    "javadoc": JavaDoc(
+                        summary="Test method",
+                        throws={
+                            "IOException": "When IO fails",
+                            "SQLException": "When SQL fails",
+                        },
+                    )
+                },
+                [
+                    "**Throws:**",
+                    "- `IOException`: When IO fails",
+                    "- `SQLException`: When SQL fails",
+                ],
+            ),
+            (
+                {
+                    "javadoc": JavaDoc(
+                        summary="Test method",
+                        examples=["testMethod();", "int result = testMethod();"],
+                    )
+                },
+                ["**Examples:**", "```java", "testMethod();"],
+            ),
+            (
+                {
+                    "signature": "public static void testMethod()",
+                    "modifiers": ["public", "static"],
+                },
+                ["**Modifiers:** public, static"],
+            ),
+            (
+                {
+                    "name": "toString",
+                    "return_type": "String",
+                    "signature": "public String toString()",
+                    "annotations": [JavaAnnotation(name="Override")],
+                },
+                ["**Annotations:** Override"],
+            ),
+        ],
+        ids=[
+            "basic",
+            "javadoc",
+            "parameters",
+            "returns",
+            "throws",
+            "examples",
+            "modifiers",
+            "annotations",
+        ],
+    )
+    def test_format_method_context(self, method_kwargs, expected):
+        """Test formatted method context contains each expected section."""
         method = JavaMethod(
-            name="testMethod",
-            return_type="void",
-            parameters=[],
-            signature="void testMethod()",
+            **{
+                "name": "testMethod",
+                "return_type": "void",
+                "parameters": [],
+                "signature": "void testMethod()",
+                **method_kwargs,
+            }
         )
         java_class = JavaClass(
             name="TestClass",
@@ -238,284 +298,83 @@ class TestFormatMethodContext:
 
         result = format_method_context(method, java_class)
 
-        assert "# com.example.TestClass.testMethod" in result
-        assert "**Signature:** `void testMethod()`" in result
-
-    def test_format_method_with_javadoc(self):
-        """Test formatting method with javadoc."""
-        javadoc = JavaDoc(
-            summary="Test method summary",
-            description="Detailed method description",
-        )
-        method = JavaMethod(
-            name="testMethod",
-            return_type="void",
-            parameters=[],
-            signature="public void testMethod()",
-            javadoc=javadoc,
-        )
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-        )
-
-        result = format_method_context(method, java_class)
-
-        assert "**Summary:** Test method summary" in result
-        assert "**Description:**" in result
-        assert "Detailed method description" in result
-
-    def test_format_method_with_parameters(self):
-        """Test formatting method with parameters."""
-        javadoc = JavaDoc(
-            summary="Test method",
-            params={"param1": "First parameter", "param2": "Second parameter"},
-        )
-        param1 = JavaParameter(name="param1", type="String")
-        param2 = JavaParameter(name="param2", type="int")
-        method = JavaMethod(
-            name="testMethod",
-            return_type="void",
-            parameters=[param1, param2],
-            signature="public void testMethod(String param1, int param2)",
-            javadoc=javadoc,
-        )
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-        )
-
-        result = format_method_context(method, java_class)
-
-        assert "**Parameters:**" in result
-        assert "- `param1`: First parameter" in result
-        assert "- `param2`: Second parameter" in result
-
-    def test_format_method_with_return(self):
-        """Test formatting method with return value."""
-        javadoc = JavaDoc(
-            summary="Test method",
-            returns="The result value",
-        )
-        method = JavaMethod(
-            name="testMethod",
-            return_type="int",
-            parameters=[],
-            signature="public int testMethod()",
-            javadoc=javadoc,
-        )
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-        )
-
-        result = format_method_context(method, java_class)
-
-        assert "**Returns:** The result value" in result
-
-    def test_format_method_with_throws(self):
-        """Test formatting method with throws clause."""
-        javadoc = JavaDoc(
-            summary="Test method",
-            throws={"IOException": "When IO fails", "SQLException": "When SQL fails"},
-        )
-        method = JavaMethod(
-            name="testMethod",
-            return_type="void",
-            parameters=[],
-            signature="public void testMethod()",
-            javadoc=javadoc,
-        )
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-        )
-
-        result = format_method_context(method, java_class)
-
-        assert "**Throws:**" in result
-        assert "- `IOException`: When IO fails" in result
-        assert "- `SQLException`: When SQL fails" in result
-
-    def test_format_method_with_examples(self):
-        """Test formatting method with examples."""
-        javadoc = JavaDoc(
-            summary="Test method",
-            examples=["testMethod();", "int result = testMethod();"],
-        )
-        method = JavaMethod(
-            name="testMethod",
-            return_type="void",
-            parameters=[],
-            signature="public void testMethod()",
-            javadoc=javadoc,
-        )
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-        )
-
-        result = format_method_context(method, java_class)
-
-        assert "**Examples:**" in result
-        assert "```java" in result
-        assert "testMethod();" in result
-
-    def test_format_method_with_modifiers(self):
-        """Test formatting method with modifiers."""
-        method = JavaMethod(
-            name="testMethod",
-            return_type="void",
-            parameters=[],
-            signature="public static void testMethod()",
-            modifiers=["public", "static"],
-        )
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-        )
-
-        result = format_method_context(method, java_class)
-
-        assert "**Modifiers:** public, static" in result
-
-    def test_format_method_with_annotations(self):
-        """Test formatting method with annotations."""
-        annotation = JavaAnnotation(name="Override")
-        method = JavaMethod(
-            name="toString",
-            return_type="String",
-            parameters=[],
-            signature="public String toString()",
-            annotations=[annotation],
-        )
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-        )
-
-        result = format_method_context(method, java_class)
-
-        assert "**Annotations:** Override" in result
+        for text in expected:
+            assert text in result
 
 
 class TestFormatMethodSignature:
     """Tests for format_method_signature function."""
 
-    def test_format_void_method(self):
-        """Test formatting void method signature."""
-        method = JavaMethod(
-            name="testMethod",
-            return_type="void",
-            parameters=[],
-        )
-
-        result = format_method_signature(method)
-
-        assert result == "void testMethod()"
-
-    def test_format_method_with_return_type(self):
-        """Test formatting method with return type."""
-        method = JavaMethod(
-            name="getValue",
-            return_type="int",
-            parameters=[],
-        )
-
-        result = format_method_signature(method)
-
-        assert result == "int getValue()"
-
-    def test_format_method_with_parameters(self):
-        """Test formatting method with parameters."""
-        param1 = JavaParameter(name="x", type="int")
-        param2 = JavaParameter(name="y", type="int")
-        method = JavaMethod(
-            name="add",
-            return_type="int",
-            parameters=[param1, param2],
-        )
-
-        result = format_method_signature(method)
-
-        assert result == "int add(int x, int y)"
-
-    def test_format_method_with_complex_types(self):
-        """Test formatting method with complex parameter types."""
-        param1 = JavaParameter(name="list", type="List<String>")
-        param2 = JavaParameter(name="map", type="Map<String, Integer>")
-        method = JavaMethod(
-            name="process",
-            return_type="void",
-            parameters=[param1, param2],
-        )
-
-        result = format_method_signature(method)
-
-        assert result == "void process(List<String> list, Map<String, Integer> map)"
+    @pytest.mark.parametrize(
+        "method,expected",
+        [
+            (
+                JavaMethod(name="testMethod", return_type="void", parameters=[]),
+                "void testMethod()",
+            ),
+            (
+                JavaMethod(name="getValue", return_type="int", parameters=[]),
+                "int getValue()",
+            ),
+            (
+                JavaMethod(
+                    name="add",
+                    return_type="int",
+                    parameters=[
+                        JavaParameter(name="x", type="int"),
+                        JavaParameter(name="y", type="int"),
+                    ],
+                ),
+                "int add(int x, int y)",
+            ),
+            (
+                JavaMethod(
+                    name="process",
+                    return_type="void",
+                    parameters=[
+                        JavaParameter(name="list", type="List<String>"),
+                        JavaParameter(name="map", type="Map<String, Integer>"),
+                    ],
+                ),
+                "void process(List<String> list, Map<String, Integer> map)",
+            ),
+        ],
+        ids=["void", "return_type", "parameters", "complex_types"],
+    )
+    def test_format_method_signature(self, method, expected):
+        """Test signature formatting for return and parameter types."""
+        assert format_method_signature(method) == expected
 
 
 class TestFormatClassHierarchy:
     """Tests for format_class_hierarchy function."""
 
-    def test_format_basic_class(self):
-        """Test formatting basic class hierarchy."""
+    @pytest.mark.parametrize(
+        "class_kwargs,expected",
+        [
+            ({}, "TestClass"),
+            ({"extends": "ParentClass"}, "TestClass extends ParentClass"),
+            (
+                {"implements": ["Serializable", "Comparable"]},
+                "TestClass implements Serializable, Comparable",
+            ),
+            (
+                {
+                    "extends": "ParentClass",
+                    "implements": ["Serializable", "Comparable"],
+                },
+                "TestClass extends ParentClass implements Serializable, Comparable",
+            ),
+        ],
+        ids=["basic", "extends", "implements", "extends_and_implements"],
+    )
+    def test_format_class_hierarchy(self, class_kwargs, expected):
+        """Test hierarchy string for extends and implements combinations."""
         java_class = JavaClass(
             name="TestClass",
             fully_qualified_name="com.example.TestClass",
             package="com.example",
+            **class_kwargs,
         )
 
-        result = format_class_hierarchy(java_class)
-
-        assert result == "TestClass"
-
-    def test_format_class_with_extends(self):
-        """Test formatting class with extends clause."""
-        java_class = JavaClass(
-            name="ChildClass",
-            fully_qualified_name="com.example.ChildClass",
-            package="com.example",
-            extends="ParentClass",
-        )
-
-        result = format_class_hierarchy(java_class)
-
-        assert result == "ChildClass extends ParentClass"
-
-    def test_format_class_with_implements(self):
-        """Test formatting class with implements clause."""
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-            implements=["Serializable", "Comparable"],
-        )
-
-        result = format_class_hierarchy(java_class)
-
-        assert result == "TestClass implements Serializable, Comparable"
-
-    def test_format_class_with_extends_and_implements(self):
-        """Test formatting class with both extends and implements."""
-        java_class = JavaClass(
-            name="ChildClass",
-            fully_qualified_name="com.example.ChildClass",
-            package="com.example",
-            extends="ParentClass",
-            implements=["Serializable", "Comparable"],
-        )
-
-        result = format_class_hierarchy(java_class)
-
-        assert (
-            result
-            == "ChildClass extends ParentClass implements Serializable, Comparable"
-        )
+        assert format_class_hierarchy(java_class) == expected
@@ -0,0 +1,77 @@
+# General Disclaimer
+#
+# **AI Generated Content**
+#
+# This project's source code and documentation were generated predominantly
+# by an Artificial Intelligence Large Language Model (AI LLM). The project
+# lead, [Rubens Gomes](https://rubensgomes.com), provided initial prompts,
+# reviewed, and made refinements to the generated output. While human review and
+# refinement have occurred, users should be aware that the output may contain
+# inaccuracies, errors, or security vulnerabilities
+#
+# **Third-Party Content Notice**
+#
+# This software may include components or snippets derived from third-party
+# sources. The software's users and distributors are responsible for ensuring
+# compliance with any underlying licenses applicable to such components.
+#
+# **Copyright Status Statement**
+#
+# Copyright protection, if any, is limited to the original human contributions and
+# modifications made to this project. The AI-generated portions of the code and
+# documentation are not subject to copyright and are considered to be in the
+# public domain.
+#
+# **Limitation of liability**
+#
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES, OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT, OR
+# OTHERWISE, ARISING FROM, OUT OF, OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# **No-Warranty Disclaimer**
+#
+# THIS SOFTWARE IS PROVIDED 'AS IS,' WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE, AND NONINFRINGEMENT.
+
+"""
+Unit tests for the generate_guide helpers.
+"""
+
+from unittest.mock import MagicMock
+
+from javamcp.context.context_builder import ContextBuilder
+from javamcp.context.guide_builder import format_guide
+
+
+class TestFormatGuide:
+    """Tests for generate_guide markdown rendering."""
+
+    def test_format_guide_header_only(self):
+        """Test guide without matches only contains the header."""
+        guide = format_guide("parse json", [], [], ContextBuilder())
+
+        assert guide == "# API Usage Guide: parse json\n"
+
+    def test_format_guide_with_classes_and_methods(self):
+        """Test guide sections and spacing."""
+        builder = MagicMock()
+        builder.build_api_summary.side_effect = ["Summary A", "Summary B"]
+        classes = [MagicMock(), MagicMock()]
+
+        guide = format_guide("parse json", classes, [MagicMock()], builder)
+
+        assert guide == (
+            "# API Usage Guide: parse json\n"
+            "\n"
+            "## Relevant Classes\n"
+            "\n"
+            "Summary A\n"
+            "\n"
+            "Summary B\n"
+            "\n"
+            "## Relevant Methods\n"
+            "\n"
+            "Found relevant methods for the use case.\n"
+        )
@@ -44,6 +44,35 @@ import pytest
 from javamcp.indexer.indexer import APIIndexer
 from javamcp.models.java_entities import JavaClass, JavaMethod
 
+_BASE_CLASS = JavaClass(
+    name="TestClass",
+    fully_qualified_name="com.example.TestClass",
+    package="com.example",
+)
+_CLASS1 = JavaClass(
+    name="Class1",
+    fully_qualified_name="com.example.Class1",
+    package="com.example",
+)
+_CLASS2 = JavaClass(
+    name="Class2",
+    fully_qualified_name="com.example.Class2",
+    package="com.example",
+)
+
+
+@pytest.fixture(scope="module")
+def _shared_indexer():
+    """Provide one APIIndexer instance for the whole module."""
+    return APIIndexer()
+
+
+@pytest.fixture
+def indexer(_shared_indexer):
+    """Provide the shared APIIndexer reset to an empty state."""
+    _shared_indexer.clear()
+    return _shared_indexer
+
 
 class TestAPIIndexer:
     """Tests for APIIndexer class."""
@@ -54,15 +83,9 @@ class TestAPIIndexer:
         assert not indexer.is_built()
         assert len(indexer.class_index) == 0
 
-    def test_add_class(self):
+    def test_add_class(self, indexer):
         """Test adding a single class to index."""
-        indexer = APIIndexer()
-
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-        )
+        java_class = _BASE_CLASS
 
         indexer.add_class(java_class, "https://github.com/example/repo.git")
 
@@ -70,38 +93,21 @@ class TestAPIIndexer:
         assert indexer.get_total_classes() == 1
         assert indexer.get_class_by_fqn("com.example.TestClass") == java_class
 
-    def test_add_classes(self):
+    def test_add_classes(self, indexer):
         """Test adding multiple classes to index."""
-        indexer = APIIndexer()
-
-        class1 = JavaClass(
-            name="Class1",
-            fully_qualified_name="com.example.Class1",
-            package="com.example",
-        )
-        class2 = JavaClass(
-            name="Class2",
-            fully_qualified_name="com.example.Class2",
-            package="com.example",
-        )
+        class1 = _CLASS1
+        class2 = _CLASS2
 
         indexer.add_classes([class1, class2], "https://github.com/example/repo.git")
 
         assert indexer.get_total_classes() == 2
 
-    def test_index_methods(self):
+    def test_index_methods(self, indexer):
         """Test indexing methods."""
-        indexer = APIIndexer()
-
         method1 = JavaMethod(name="doSomething", return_type="void")
         method2 = JavaMethod(name="calculate", return_type="int")
 
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-            methods=[method1, method2],
-        )
+        java_class = _BASE_CLASS.model_copy(update={"methods": [method1, method2]})
 
         indexer.add_class(java_class, "https://github.com/example/repo.git")
 
@@ -110,15 +116,9 @@ class TestAPIIndexer:
         assert len(methods) == 1
         assert methods[0][1].name == "doSomething"
 
-    def test_get_classes_by_name(self):
+    def test_get_classes_by_name(self, indexer):
         """Test getting classes by simple name."""
-        indexer = APIIndexer()
-
-        class1 = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-        )
+        class1 = _BASE_CLASS
         class2 = JavaClass(
             name="TestClass",
             fully_qualified_name="org.other.TestClass",
@@ -131,20 +131,10 @@ class TestAPIIndexer:
         classes = indexer.get_classes_by_name("TestClass")
         assert len(classes) == 2
 
-    def test_get_classes_by_package(self):
+    def test_get_classes_by_package(self, indexer):
         """Test getting classes by package."""
-        indexer = APIIndexer()
-
-        class1 = JavaClass(
-            name="Class1",
-            fully_qualified_name="com.example.Class1",
-            package="com.example",
-        )
-        class2 = JavaClass(
-            name="Class2",
-            fully_qualified_name="com.example.Class2",
-            package="com.example",
-        )
+        class1 = _CLASS1
+        class2 = _CLASS2
         class3 = JavaClass(
             name="Class3",
             fully_qualified_name="org.other.Class3",
@@ -158,15 +148,9 @@ class TestAPIIndexer:
         classes = indexer.get_classes_by_package("com.example")
         assert len(classes) == 2
 
-    def test_get_classes_by_repository(self):
+    def test_get_classes_by_repository(self, indexer):
         """Test getting classes by repository."""
-        indexer = APIIndexer()
-
-        class1 = JavaClass(
-            name="Class1",
-            fully_qualified_name="com.example.Class1",
-            package="com.example",
-        )
+        class1 = _CLASS1
         class2 = JavaClass(
             name="Class2",
             fully_qualified_name="org.other.Class2",
@@ -182,43 +166,26 @@ class TestAPIIndexer:
         assert len(repo1_classes) == 1
         assert repo1_classes[0].name == "Class1"
 
-    def test_get_methods_by_class(self):
+    def test_get_methods_by_class(self, indexer):
         """Test getting methods by class name."""
-        indexer = APIIndexer()
-
         method1 = JavaMethod(name="method1", return_type="void")
         method2 = JavaMethod(name="method2", return_type="int")
 
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-            methods=[method1, method2],
-        )
+        java_class = _BASE_CLASS.model_copy(update={"methods": [method1, method2]})
 
         indexer.add_class(java_class, "https://github.com/example/repo.git")
 
         methods = indexer.get_methods_by_class("com.example.TestClass")
         assert len(methods) == 2
 
-    def test_reindex_repository(self):
+    def test_reindex_repository(self, indexer):
         """Test re-indexing a repository."""
-        indexer = APIIndexer()
-
         # Initial index
-        class1 = JavaClass(
-            name="Class1",
-            fully_qualified_name="com.example.Class1",
-            package="com.example",
-        )
+        class1 = _CLASS1
         indexer.add_class(class1, "https://github.com/repo.git")
 
         # Re-index with new classes
-        class2 = JavaClass(
-            name="Class2",
-            fully_qualified_name="com.example.Class2",
-            package="com.example",
-        )
+        class2 = _CLASS2
         indexer.reindex_repository("https://github.com/repo.git", [class2])
 
         # Old class should be gone
@@ -226,15 +193,9 @@ class TestAPIIndexer:
         # New class should be present
         assert indexer.get_class_by_fqn("com.example.Class2") is not None
 
-    def test_clear(self):
+    def test_clear(self, indexer):
         """Test clearing the index."""
-        indexer = APIIndexer()
-
-        java_class = JavaClass(
-            name="TestClass",
-            fully_qualified_name="com.example.TestClass",
-            package="com.example",
-        )
+        java_class = _BASE_CLASS
         indexer.add_class(java_class, "https://github.com/example/repo.git")
 
         assert indexer.is_built()
@@ -242,22 +203,197 @@ class TestAPIIndexer:
         assert not indexer.is_built()
         assert indexer.get_total_classes() == 0
 
-    def test_get_all_classes(self):
+    def test_get_all_classes(self, indexer):
         """Test getting all classes."""
-        indexer = APIIndexer()
+        class1 = _CLASS1
+        class2 = _CLASS2
+
+        indexer.add_classes([class1, class2], "https://github.com/example/repo.git")
+
+        all_classes = indexer.get_all_classes()
+        assert len(all_classes) == 2
 
+    def test_find_method_names(self, indexer):
+        """Test finding method names by case-insensitive substring."""
+        java_class = JavaClass(
+            name="FileUtils",
+            fully_qualified_name="com.example.FileUtils",
+            package="com.example",
+            methods=[
+                JavaMethod(name="readFile", return_type="String"),
+                JavaMethod(name="writeFile", return_type="void"),
+                JavaMethod(name="close", return_type="void"),
+            ],
+        )
+        indexer.add_class(java_class, "https://github.com/example/repo.git")
+
+        assert indexer.find_method_names("FILE") == ["readFile", "writeFile"]
+        assert indexer.find_method_names("eFi") == ["writeFile"]
+        assert indexer.find_method_names("os") == ["close"]
+        assert indexer.find_method_names("missing") == []
+
+    def test_find_method_names_short_patterns(self, indexer):
+        """Test one and two character patterns use the n-gram index."""
+        java_class = JavaClass(
+            name="FileUtils",
+            fully_qualified_name="com.example.FileUtils",
+            package="com.example",
+            methods=[
+                JavaMethod(name="readFile", return_type="String"),
+                JavaMethod(name="close", return_type="void"),
+            ],
+        )
+        indexer.add_class(java_class, "https://github.com/example/repo.git")
+
+        assert indexer.find_method_names("") == ["readFile", "close"]
+        assert indexer.find_method_names("E") == ["readFile", "close"]
+        assert indexer.find_method_names("cl") == ["close"]
+        assert indexer.find_method_names("xz") == []
+        assert "cl" in indexer.method_ngram_index
+
+        indexer.reindex_repository("https://github.com/example/repo.git", [])
+
+        assert indexer.find_method_names("e") == []
+        assert not indexer.method_ngram_index
+
+    def test_reindex_repository_updates_ngram_index(self, indexer):
+        """Test removed method names are no longer found by substring."""
         class1 = JavaClass(
             name="Class1",
             fully_qualified_name="com.example.Class1",
             package="com.example",
+            methods=[JavaMethod(name="oldMethod", return_type="void")],
         )
+        indexer.add_class(class1, "https://github.com/repo.git")
+
         class2 = JavaClass(
             name="Class2",
             fully_qualified_name="com.example.Class2",
             package="com.example",
+            methods=[JavaMethod(name="newMethod", return_type="void")],
         )
+        indexer.reindex_repository("https://github.com/repo.git", [class2])
 
-        indexer.add_classes([class1, class2], "https://github.com/example/repo.git")
+        assert indexer.find_method_names("Method") == ["newMethod"]
+        assert "oldMethod" not in indexer.method_index
 
-        all_classes = indexer.get_all_classes()
-        assert len(all_classes) == 2
+    def test_case_insensitive_lookups(self, indexer):
+        """Test lowercase indices for class and method lookups."""
+        java_class = JavaClass(
+            name="HttpClient",
+            fully_qualified_name="com.example.HttpClient",
+            package="com.example",
+            methods=[
+                JavaMethod(name="sendRequest", return_type="void"),
+                JavaMethod(name="SendRequest", return_type="void"),
+            ],
+        )
+        indexer.add_class(java_class, "https://github.com/repo.git")
+
+        assert indexer.get_class_by_fqn_ignore_case("COM.EXAMPLE.HTTPCLIENT") is (
+            java_class
+        )
+        methods = indexer.get_methods_by_name_ignore_case("SENDREQUEST")
+        assert [m.name for _, m in methods] == ["sendRequest", "SendRequest"]
+
+        indexer.reindex_repository("https://github.com/repo.git", [])
+
+        assert indexer.get_class_by_fqn_ignore_case("com.example.httpclient") is None
+        assert indexer.get_methods_by_name_ignore_case("sendrequest") == []
+
+    def test_get_classes_by_name_ignore_case(self, indexer):
+        """Test case-insensitive simple class name lookup."""
+        class1 = JavaClass(
+            name="JsonParser",
+            fully_qualified_name="com.example.JsonParser",
+            package="com.example",
+        )
+        class2 = JavaClass(
+            name="JSONParser",
+            fully_qualified_name="org.other.JSONParser",
+            package="org.other",
+        )
+        indexer.add_class(class1, "https://github.com/repo1.git")
+        indexer.add_class(class2, "https://github.com/repo2.git")
+
+        classes = indexer.get_classes_by_name_ignore_case("jsonparser")
+        assert [c.fully_qualified_name for c in classes] == [
+            "com.example.JsonParser",
+            "org.other.JSONParser",
+        ]
+
+        indexer.reindex_repository("https://github.com/repo2.git", [])
+
+        classes = indexer.get_classes_by_name_ignore_case("JSONPARSER")
+        assert [c.name for c in classes] == ["JsonParser"]
+        assert "JSONParser" not in indexer.class_name_index
+
+    def test_generation_changes_on_mutation(self, indexer):
+        """Test generation counter advances on add, re-index and clear."""
+        java_class = _CLASS1
+
+        generations = [indexer.generation]
+        indexer.add_class(java_class, "https://github.com/repo.git")
+        generations.append(indexer.generation)
+        indexer.reindex_repository("https://github.com/repo.git", [])
+        generations.append(indexer.generation)
+        indexer.clear()
+        generations.append(indexer.generation)
+
+        assert generations == sorted(set(generations))
+
+    def test_get_total_methods_tracks_mutations(self, indexer):
+        """Test method count follows add, re-index and clear."""
+        run = JavaMethod(name="run", return_type="void")
+        stop = JavaMethod(name="stop", return_type="void")
+
+        indexer.add_class(
+            _CLASS1.model_copy(update={"methods": [run, stop]}),
+            "https://github.com/repo1.git",
+        )
+        indexer.add_class(
+            _CLASS2.model_copy(update={"methods": [run]}),
+            "https://github.com/repo2.git",
+        )
+        assert indexer.get_total_methods() == 3
+
+        indexer.reindex_repository("https://github.com/repo1.git", [])
+        assert indexer.get_total_methods() == 1
+
+        indexer.clear()
+        assert indexer.get_total_methods() == 0
+
+    def test_reindex_repository_drops_empty_packages(self, indexer):
+        """Test packages left without classes are removed from the index."""
+        other = JavaClass(
+            name="Helper",
+            fully_qualified_name="org.other.Helper",
+            package="org.other",
+        )
+        indexer.add_classes([_CLASS1, _CLASS2], "https://github.com/repo1.git")
+        indexer.add_class(other, "https://github.com/repo2.git")
+
+        indexer.reindex_repository("https://github.com/repo1.git", [])
+
+        assert "com.example" not in indexer.package_index
+        assert indexer.get_classes_by_package("com.example") == []
+        assert indexer.get_classes_by_package("org.other") == [other]
+
+    def test_reindex_repository_skips_unchanged_classes(self, indexer):
+        """Test re-indexing with the same classes leaves the index untouched."""
+        url = "https://github.com/repo.git"
+        indexer.add_classes([_CLASS1, _CLASS2], url)
+        generation = indexer.generation
+
+        indexer.reindex_repository(url, [_CLASS1, _CLASS2])
+        assert indexer.generation == generation
+
+        indexer.reindex_repository(url, [_CLASS1, _CLASS2], force=True)
+        assert indexer.generation > generation
+        assert indexer.get_total_classes() == 2
+
+        changed = _CLASS2.model_copy(update={"extends": "com.example.Base"})
+        generation = indexer.generation
+        indexer.reindex_repository(url, [_CLASS1, changed])
+        assert indexer.generation > generation
+        assert indexer.get_class_by_fqn("com.example.Class2") is changed
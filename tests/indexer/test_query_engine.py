@@ -39,6 +39,9 @@
 Unit tests for QueryEngine.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 import pytest
 
 from javamcp.indexer.exceptions import IndexNotBuiltError, RepositoryNotIndexedError
@@ -149,6 +152,149 @@ class TestQueryEngine:
         results = engine.search_methods_partial("getUser")
         assert len(results) == 2
 
+    def test_search_methods_partial_case_sensitive(self):
+        """Test case-sensitive partial search and short patterns."""
+        indexer = APIIndexer()
+        engine = QueryEngine(indexer)
+
+        java_class = JavaClass(
+            name="User",
+            fully_qualified_name="com.example.User",
+            package="com.example",
+            methods=[
+                JavaMethod(name="getUserName", return_type="String"),
+                JavaMethod(name="username", return_type="String"),
+                JavaMethod(name="id", return_type="long"),
+            ],
+        )
+        indexer.add_class(java_class, "https://github.com/example/repo.git")
+
+        results = engine.search_methods_partial("UserName", case_sensitive=True)
+        assert [m.name for _, m in results] == ["getUserName"]
+
+        results = engine.search_methods_partial("username")
+        assert [m.name for _, m in results] == ["getUserName", "username"]
+
+        results = engine.search_methods_partial("d")
+        assert [m.name for _, m in results] == ["id"]
+
+    def test_search_keyword_cached_until_index_changes(self):
+        """Test keyword results are memoized per indexer generation."""
+        indexer = APIIndexer()
+        engine = QueryEngine(indexer)
+
+        indexer.add_class(
+            JavaClass(
+                name="Reader",
+                fully_qualified_name="com.example.Reader",
+                package="com.example",
+                methods=[JavaMethod(name="readLine", return_type="String")],
+            ),
+            "https://github.com/example/repo.git",
+        )
+
+        methods, classes = engine.search_keyword("reader")
+        assert methods == []
+        assert [c.name for c in classes] == ["Reader"]
+
+        with patch.object(engine, "search_methods_partial") as mock_partial:
+            assert engine.search_keyword("reader") == (methods, classes)
+            mock_partial.assert_not_called()
+
+        indexer.add_class(
+            JavaClass(
+                name="FileReaderUtil",
+                fully_qualified_name="com.example.FileReaderUtil",
+                package="com.example",
+                methods=[JavaMethod(name="openReader", return_type="void")],
+            ),
+            "https://github.com/example/repo.git",
+        )
+
+        methods, _ = engine.search_keyword("reader")
+        assert [m.name for _, m in methods] == ["openReader"]
+
+    def test_search_keyword_cache_bounded_under_concurrency(self):
+        """Test concurrent lookups evict entries safely and stay bounded."""
+        indexer = APIIndexer()
+        engine = QueryEngine(indexer)
+        indexer.add_class(
+            JavaClass(
+                name="Reader",
+                fully_qualified_name="com.example.Reader",
+                package="com.example",
+            ),
+            "https://github.com/example/repo.git",
+        )
+        keywords = [f"keyword{i}" for i in range(200)]
+
+        with patch("javamcp.indexer.query_engine.KEYWORD_CACHE_SIZE", 8):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(engine.search_keyword, keywords * 4))
+
+        assert all(result == ([], []) for result in results)
+        assert len(engine._keyword_cache) <= 8
+
+    def test_search_any_spreads_budget_across_keywords(self):
+        """Test each keyword contributes results, without duplicates."""
+        indexer = APIIndexer()
+        engine = QueryEngine(indexer)
+
+        indexer.add_class(
+            JavaClass(
+                name="Reader",
+                fully_qualified_name="com.example.Reader",
+                package="com.example",
+                methods=[
+                    JavaMethod(name="readLine", return_type="String"),
+                    JavaMethod(name="readAll", return_type="String"),
+                    JavaMethod(name="writeLine", return_type="void"),
+                ],
+            ),
+            "https://github.com/example/repo.git",
+        )
+
+        classes, methods = engine.search_any(["read", "line", "readline"], 6)
+
+        assert classes == []
+        assert [m.name for m in methods] == ["readLine", "readAll", "writeLine"]
+
+        classes, methods = engine.search_any(["read", "reader"], 2)
+
+        assert [c.name for c in classes] == ["Reader"]
+        assert [m.name for m in methods] == ["readLine"]
+
+    def test_search_any_deduplicates_keyword_matches(self):
+        """Test APIs found by several keywords are returned once."""
+        indexer = APIIndexer()
+        indexer.add_class(
+            JavaClass(
+                name="JsonReader",
+                fully_qualified_name="com.example.JsonReader",
+                package="com.example",
+                methods=[
+                    JavaMethod(name="readJson", return_type="String"),
+                    JavaMethod(name="readJsonArray", return_type="String"),
+                ],
+            ),
+            "test-repo",
+        )
+
+        classes, methods = QueryEngine(indexer).search_any(
+            ["read", "json", "readjson"], 6
+        )
+
+        assert classes == []
+        assert [m.name for m in methods] == ["readJson", "readJsonArray"]
+
+    def test_search_any_without_keywords(self):
+        """Test no keywords yields no APIs without querying."""
+        engine = QueryEngine(APIIndexer())
+
+        with patch.object(engine, "search_keyword") as mock_search:
+            assert engine.search_any([], 10) == ([], [])
+            mock_search.assert_not_called()
+
     def test_search_class(self):
         """Test searching for a class."""
         indexer = APIIndexer()
@@ -182,6 +328,25 @@ class TestQueryEngine:
         result = engine.search_class("com.example.testclass", case_sensitive=False)
         assert result is not None
 
+    def test_check_repository_indexed(self):
+        """Test only repositories with indexed classes pass the check."""
+        indexer = APIIndexer()
+        engine = QueryEngine(indexer)
+        indexer.add_class(
+            JavaClass(
+                name="Class1",
+                fully_qualified_name="com.example.Class1",
+                package="com.example",
+            ),
+            "https://github.com/repo1.git",
+        )
+
+        assert engine.is_repository_indexed("https://github.com/repo1.git")
+        assert not engine.is_repository_indexed("https://github.com/other.git")
+        engine.check_repository_indexed("https://github.com/repo1.git")
+        with pytest.raises(RepositoryNotIndexedError, match="other.git"):
+            engine.check_repository_indexed("https://github.com/other.git")
+
     def test_filter_classes_by_repository(self):
         """Test filtering classes by repository."""
         indexer = APIIndexer()
@@ -220,6 +385,46 @@ class TestQueryEngine:
         with pytest.raises(RepositoryNotIndexedError):
             engine.filter_classes_by_repository("https://github.com/other.git")
 
+    def test_repository_of(self):
+        """Test looking up the repository of an indexed class."""
+        indexer = APIIndexer()
+        engine = QueryEngine(indexer)
+
+        class1 = JavaClass(
+            name="Class1",
+            fully_qualified_name="com.example.Class1",
+            package="com.example",
+        )
+        class2 = JavaClass(
+            name="Class2",
+            fully_qualified_name="com.example.Class2",
+            package="com.example",
+        )
+        indexer.add_class(class1, "https://github.com/repo1.git")
+
+        assert engine.repository_of(class1) == "https://github.com/repo1.git"
+        assert engine.repository_of(class2) is None
+
+        indexer.reindex_repository("https://github.com/repo1.git", [])
+        assert engine.repository_of(class1) is None
+
+    def test_is_class_in_repository(self):
+        """Test repository membership check for an indexed class."""
+        indexer = APIIndexer()
+        engine = QueryEngine(indexer)
+
+        java_class = JavaClass(
+            name="Class1",
+            fully_qualified_name="com.example.Class1",
+            package="com.example",
+        )
+        indexer.add_class(java_class, "https://github.com/repo1.git")
+
+        assert engine.is_class_in_repository(java_class, "https://github.com/repo1.git")
+        assert not engine.is_class_in_repository(
+            java_class, "https://github.com/repo2.git"
+        )
+
     def test_filter_classes_by_package(self):
         """Test filtering classes by package."""
         indexer = APIIndexer()
@@ -592,6 +592,22 @@ class TestLogHelpers:
         assert "method_name=testMethod" in caplog.text
         assert "class_name=TestClass" in caplog.text
 
+    def test_log_tool_invocation_disabled_level(self):
+        """Test parameters are not formatted when INFO is disabled."""
+        logger = logging.getLogger("test.disabled")
+        logger.setLevel(logging.WARNING)
+
+        class Unformattable:
+            """Parameter that fails the test if it is ever formatted."""
+
+            def __format__(self, format_spec):
+                raise AssertionError("parameter was formatted")
+
+        with patch.object(logger, "info") as mock_info:
+            log_tool_invocation(logger, "search_methods", method_name=Unformattable())
+
+        mock_info.assert_not_called()
+
     def test_log_repository_operation_success(self, caplog):
         """Test repository operation logging (success)."""
         logger = logging.getLogger("test")
@@ -205,6 +205,57 @@ class TestJavaSourceParser:
         with pytest.raises(InvalidJavaSourceError, match="File not found"):
             parser.parse_file("/nonexistent/file.java")
 
+    def test_parse_file_invalid_source(self, tmp_path):
+        """Test parsing an invalid Java file raises with the parse errors."""
+        invalid = tmp_path / "Invalid.java"
+        invalid.write_text("this is not valid java code {{{")
+
+        parser = JavaSourceParser()
+        with pytest.raises(ParseError, match="Parse errors in"):
+            parser.parse_file(str(invalid))
+
+    def test_try_parse_file(self, tmp_path):
+        """Test try_parse_file returns a class or None without raising."""
+        valid = tmp_path / "Valid.java"
+        valid.write_text("package com.example; public class Valid {}")
+        invalid = tmp_path / "Invalid.java"
+        invalid.write_text("this is not valid java code {{{")
+        package_info = tmp_path / "package-info.java"
+        package_info.write_text("package com.example;")
+
+        parser = JavaSourceParser()
+
+        java_class = parser.try_parse_file(str(valid))
+        assert java_class is not None
+        assert java_class.fully_qualified_name == "com.example.Valid"
+        assert parser.try_parse_file(str(invalid)) is None
+        assert parser.try_parse_file(str(package_info)) is None
+        assert parser.try_parse_file(str(tmp_path / "Missing.java")) is None
+
+    def test_parse_files(self, tmp_path):
+        """Test batch parsing yields a result for every path in order."""
+        valid = tmp_path / "Valid.java"
+        valid.write_text("package com.example; public class Valid {}")
+        invalid = tmp_path / "Invalid.java"
+        invalid.write_text("this is not valid java code {{{")
+
+        parser = JavaSourceParser()
+        results = list(parser.parse_files([str(valid), str(invalid)]))
+
+        assert [path for path, _ in results] == [str(valid), str(invalid)]
+        assert results[0][1].fully_qualified_name == "com.example.Valid"
+        assert results[1][1] is None
+
+    def test_parse_shares_package_name_string(self):
+        """Test classes from the same package share one interned package name."""
+        parser = JavaSourceParser()
+
+        first = parser.parse_string("package com.example; public class A {}")
+        second = parser.parse_string("package com.example; public class B {}")
+
+        assert first.package == "com.example"
+        assert first.package is second.package
+
     def test_parse_class_without_package(self):
         """Test parsing class without package declaration."""
         java_code = """
@@ -74,7 +74,10 @@ class TestCloneRepository:
 
         assert repo == mock_repo
         mock_repo_class.clone_from.assert_called_once_with(
-            "https://github.com/example/repo.git", "/tmp/repo", depth=1
+            "https://github.com/example/repo.git",
+            "/tmp/repo",
+            depth=1,
+            single_branch=True,
         )
 
     @patch("javamcp.repository.git_operations.Repo")
@@ -92,6 +95,7 @@ class TestCloneRepository:
             "/tmp/repo",
             branch="develop",
             depth=1,
+            single_branch=True,
         )
 
     @patch("javamcp.repository.git_operations.Repo")
@@ -103,7 +107,10 @@ class TestCloneRepository:
         clone_repository("https://github.com/example/repo.git", "/tmp/repo", depth=5)
 
         mock_repo_class.clone_from.assert_called_once_with(
-            "https://github.com/example/repo.git", "/tmp/repo", depth=5
+            "https://github.com/example/repo.git",
+            "/tmp/repo",
+            depth=5,
+            single_branch=True,
         )
 
     @patch("javamcp.repository.git_operations.Repo")
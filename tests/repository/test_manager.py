@@ -40,6 +40,9 @@ Unit tests for RepositoryManager.
 """
 
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -110,6 +113,140 @@ class TestRepositoryManager:
         mock_clone.assert_called_once()
         assert "https://github.com/example/repo.git" in manager.repositories
 
+    @patch("javamcp.repository.manager.Path.mkdir")
+    @patch("javamcp.repository.manager.Path.exists")
+    @patch("javamcp.repository.manager.is_git_repository")
+    @patch("javamcp.repository.manager.clone_repository")
+    @patch("javamcp.repository.manager.get_current_branch_name")
+    @patch("javamcp.repository.manager.get_current_commit_hash")
+    def test_initialize_repositories_clones_all_urls(
+        self,
+        mock_commit_hash,
+        mock_branch_name,
+        mock_clone,
+        mock_is_git,
+        mock_exists,
+        mock_mkdir,
+    ):
+        """Test initializing several repositories clones each one."""
+        urls = [f"https://github.com/example/repo{i}.git" for i in range(5)]
+        config = RepositoryConfig(urls=urls, local_base_path="/tmp/repos")
+        manager = RepositoryManager(config)
+
+        mock_exists.return_value = False
+        mock_commit_hash.return_value = "abc123"
+        mock_branch_name.return_value = "main"
+
+        manager.initialize_repositories()
+
+        assert mock_clone.call_count == len(urls)
+        assert set(manager.repositories) == set(urls)
+
+    @patch("javamcp.repository.manager.is_git_repository", return_value=True)
+    @patch("javamcp.repository.manager.clone_repository")
+    @patch("javamcp.repository.manager.get_current_branch_name")
+    @patch("javamcp.repository.manager.get_current_commit_hash")
+    def test_initialize_repositories_clones_shared_path_once(
+        self, mock_commit_hash, mock_branch_name, mock_clone, mock_is_git
+    ):
+        """Test URLs sharing a checkout directory are not cloned twice."""
+        urls = [
+            "https://github.com/example/repo.git",
+            "https://gitlab.com/other/repo.git",
+            "https://github.com/example/repo.git",
+        ]
+        config = RepositoryConfig(
+            urls=urls, local_base_path=tempfile.mkdtemp(), auto_update=False
+        )
+        manager = RepositoryManager(config)
+        mock_clone.side_effect = lambda url, path, depth: Path(path).mkdir()
+        mock_commit_hash.return_value = "abc123"
+        mock_branch_name.return_value = "main"
+
+        manager.initialize_repositories()
+
+        mock_clone.assert_called_once()
+        assert set(manager.repositories) == set(urls)
+
+    @patch("javamcp.repository.manager.clone_repository")
+    @patch("javamcp.repository.manager.get_current_branch_name")
+    @patch("javamcp.repository.manager.get_current_commit_hash")
+    def test_ensure_repository_clones_once(
+        self, mock_commit_hash, mock_branch_name, mock_clone
+    ):
+        """Test an unknown repository is cloned once and then reused."""
+        config = RepositoryConfig(
+            urls=["https://github.com/example/repo.git"],
+            local_base_path=tempfile.mkdtemp(),
+        )
+        manager = RepositoryManager(config)
+        mock_commit_hash.return_value = "abc123"
+        mock_branch_name.return_value = "main"
+        url = "https://github.com/example/extra.git"
+
+        first = manager.ensure_repository(url)
+        second = manager.ensure_repository(url)
+
+        mock_clone.assert_called_once()
+        assert first is second
+        assert first.branch == "main"
+        assert manager.get_repository_metadata(url) is first
+
+    @patch("javamcp.repository.manager.clone_repository")
+    @patch("javamcp.repository.manager.get_current_branch_name")
+    @patch("javamcp.repository.manager.get_current_commit_hash")
+    def test_ensure_repository_does_not_wait_on_other_clones(
+        self, mock_commit_hash, mock_branch_name, mock_clone
+    ):
+        """Test a slow clone does not block other repositories."""
+        config = RepositoryConfig(
+            urls=["https://github.com/example/repo.git"],
+            local_base_path=tempfile.mkdtemp(),
+        )
+        manager = RepositoryManager(config)
+        mock_commit_hash.return_value = "abc123"
+        mock_branch_name.return_value = "main"
+        slow_url = "https://github.com/example/slow.git"
+        tracked_url = "https://github.com/example/tracked.git"
+        other_url = "https://github.com/example/other.git"
+        manager.ensure_repository(tracked_url)
+
+        clone_started = threading.Event()
+        release_clone = threading.Event()
+
+        def clone(url, path, depth):
+            if url == slow_url:
+                clone_started.set()
+                release_clone.wait(timeout=5)
+
+        mock_clone.side_effect = clone
+        slow = threading.Thread(target=manager.ensure_repository, args=(slow_url,))
+        slow.start()
+        try:
+            assert clone_started.wait(timeout=5)
+
+            assert manager.ensure_repository(tracked_url).url == tracked_url
+            assert manager.ensure_repository(other_url).url == other_url
+            assert slow_url not in manager.repositories
+        finally:
+            release_clone.set()
+            slow.join(timeout=5)
+
+        assert slow_url in manager.repositories
+
+    @patch("javamcp.repository.manager.clone_repository")
+    def test_initialize_repositories_propagates_clone_error(self, mock_clone):
+        """Test a failed clone is raised from initialize_repositories."""
+        config = RepositoryConfig(
+            urls=["https://github.com/example/repo.git"],
+            local_base_path=tempfile.mkdtemp(),
+        )
+        manager = RepositoryManager(config)
+        mock_clone.side_effect = RuntimeError("network down")
+
+        with pytest.raises(RuntimeError, match="network down"):
+            manager.initialize_repositories()
+
     @patch("javamcp.repository.manager.Path.mkdir")
     @patch("javamcp.repository.manager.Path.exists")
     @patch("javamcp.repository.manager.is_git_repository")
@@ -313,6 +450,192 @@ class TestRepositoryManager:
             assert len(filtered_files) == 1
             assert "UserService.java" in str(filtered_files[0])
 
+    def test_filter_java_files_by_leading_package_path(self, tmp_path):
+        """Test a multi-part package path matches files below that directory."""
+        config = RepositoryConfig(
+            urls=["https://github.com/example/repo.git"],
+            local_base_path=str(tmp_path),
+        )
+        manager = RepositoryManager(config)
+
+        repo_path = tmp_path / "test_repo"
+        service_path = repo_path / "src" / "com" / "example" / "service"
+        service_path.mkdir(parents=True)
+        (service_path / "UserService.java").touch()
+        (repo_path / "src" / "Main.java").touch()
+        (repo_path / "test" / "util").mkdir(parents=True)
+        (repo_path / "test" / "util" / "Helper.java").touch()
+        (repo_path / "Other.java").touch()
+
+        from javamcp.models.repository import RepositoryMetadata
+
+        manager.repositories["https://github.com/example/repo.git"] = (
+            RepositoryMetadata(
+                url="https://github.com/example/repo.git",
+                branch="main",
+                local_path=str(repo_path),
+            )
+        )
+
+        filtered_files = manager.filter_java_files_by_package(
+            "https://github.com/example/repo.git", "src/com"
+        )
+
+        assert [f.name for f in filtered_files] == ["UserService.java"]
+        assert all(isinstance(f, Path) for f in filtered_files)
+
+    def test_get_java_files_cached_reuses_listing_until_head_moves(self):
+        """Test cached Java file listings are keyed by the current commit."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = RepositoryConfig(
+                urls=["https://github.com/example/repo.git"],
+                local_base_path=tmpdir,
+            )
+            manager = RepositoryManager(config)
+
+            repo_path = Path(tmpdir) / "test_repo"
+            src_path = repo_path / "src" / "com" / "example" / "service"
+            src_path.mkdir(parents=True)
+            (src_path / "UserService.java").touch()
+            (repo_path / "Other.java").touch()
+
+            from javamcp.models.repository import RepositoryMetadata
+
+            url = "https://github.com/example/repo.git"
+            manager.repositories[url] = RepositoryMetadata(
+                url=url,
+                branch="main",
+                local_path=str(repo_path),
+                commit_hash="abc123",
+            )
+
+            first = manager.get_java_files_cached(url)
+            service = manager.get_java_files_cached(url, "service")
+            (repo_path / "Added.java").touch()
+
+            assert len(first) == 2
+            assert [Path(f).name for f in service] == ["UserService.java"]
+            assert manager.get_java_files_cached(url) is first
+
+            manager.repositories[url].commit_hash = "def456"
+
+            assert len(manager.get_java_files_cached(url)) == 3
+
+    def test_get_java_files_cached_bounded_under_concurrency(self, tmp_path):
+        """Test concurrent listings evict entries safely and stay bounded."""
+        from javamcp.models.repository import RepositoryMetadata
+
+        config = RepositoryConfig(
+            urls=["https://github.com/example/repo.git"],
+            local_base_path=str(tmp_path),
+        )
+        manager = RepositoryManager(config)
+        (tmp_path / "Main.java").touch()
+        url = "https://github.com/example/repo.git"
+        manager.repositories[url] = RepositoryMetadata(
+            url=url, branch="main", local_path=str(tmp_path), commit_hash="abc123"
+        )
+        package_filters = [f"pkg{i}" for i in range(50)]
+
+        with patch("javamcp.repository.manager.JAVA_FILES_CACHE_SIZE", 4):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(
+                    executor.map(
+                        partial(manager.get_java_files_cached, url),
+                        package_filters * 4,
+                    )
+                )
+
+        assert all(result == () for result in results)
+        assert len(manager._java_files_cache) <= 4
+
+    def test_get_java_files_cached_not_found(self):
+        """Test cached listing of an unknown repository raises error."""
+        config = RepositoryConfig(
+            urls=["https://github.com/example/repo.git"],
+            local_base_path="/tmp/repos",
+        )
+        manager = RepositoryManager(config)
+
+        with pytest.raises(RepositoryNotFoundError, match="not managed"):
+            manager.get_java_files_cached("https://github.com/other/repo.git")
+
+    def test_iter_java_files_not_found_raises_eagerly(self):
+        """Test unknown repository is reported before iteration starts."""
+        config = RepositoryConfig(
+            urls=["https://github.com/example/repo.git"],
+            local_base_path="/tmp/repos",
+        )
+        manager = RepositoryManager(config)
+
+        with pytest.raises(RepositoryNotFoundError, match="not managed"):
+            manager.iter_java_files("https://github.com/other/repo.git")
+
+    def test_iter_java_files_by_package(self):
+        """Test lazily filtering Java files by package path."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = RepositoryConfig(
+                urls=["https://github.com/example/repo.git"],
+                local_base_path=tmpdir,
+            )
+            manager = RepositoryManager(config)
+
+            repo_path = Path(tmpdir) / "test_repo"
+            src_path = repo_path / "src" / "com" / "example" / "service"
+            src_path.mkdir(parents=True)
+            (src_path / "UserService.java").touch()
+            (repo_path / "Other.java").touch()
+
+            from javamcp.models.repository import RepositoryMetadata
+
+            metadata = RepositoryMetadata(
+                url="https://github.com/example/repo.git",
+                branch="main",
+                local_path=str(repo_path),
+            )
+            manager.repositories["https://github.com/example/repo.git"] = metadata
+
+            files = manager.iter_java_files_by_package(
+                "https://github.com/example/repo.git", "service"
+            )
+
+            assert not isinstance(files, list)
+            assert [f.name for f in files] == ["UserService.java"]
+
+    def test_iter_java_files_walks_nested_directories(self, tmp_path):
+        """Test only Java files are yielded and symlinked dirs are not followed."""
+        config = RepositoryConfig(
+            urls=["https://github.com/example/repo.git"],
+            local_base_path=str(tmp_path),
+        )
+        manager = RepositoryManager(config)
+
+        repo_path = tmp_path / "test_repo"
+        src_path = repo_path / "src" / "main" / "java" / "com" / "example"
+        src_path.mkdir(parents=True)
+        (src_path / "Main.java").touch()
+        (src_path / "README.txt").touch()
+        (repo_path / "generated.java").mkdir()
+        (repo_path / "generated.java" / "Gen.java").touch()
+        (repo_path / "linked").symlink_to(repo_path / "src", target_is_directory=True)
+
+        from javamcp.models.repository import RepositoryMetadata
+
+        manager.repositories["https://github.com/example/repo.git"] = (
+            RepositoryMetadata(
+                url="https://github.com/example/repo.git",
+                branch="main",
+                local_path=str(repo_path),
+            )
+        )
+
+        files = manager.iter_java_files("https://github.com/example/repo.git")
+
+        assert sorted(f.relative_to(repo_path).as_posix() for f in files) == [
+            "generated.java/Gen.java",
+            "src/main/java/com/example/Main.java",
+        ]
+
     def test_get_repository_metadata(self):
         """Test getting repository metadata."""
         config = RepositoryConfig(
@@ -39,17 +39,30 @@
 Unit tests for JavaMCP FastMCP server.
 """
 
+import gc
+import json
+import os
+import re
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from javamcp.config.schema import ApplicationConfig, RepositoryConfig
+from javamcp.context.context_builder import ContextBuilder
 from javamcp.indexer.indexer import APIIndexer
 from javamcp.indexer.query_engine import QueryEngine
-from javamcp.models.java_entities import JavaClass
+from javamcp.models.java_entities import JavaClass, JavaMethod
+from javamcp.parser.java_parser import JavaSourceParser
 from javamcp.repository.manager import RepositoryManager
-from javamcp.server import get_state, initialize_server
+from javamcp.server import (
+    _dump_cache,
+    _dump_cached,
+    get_state,
+    initialize_server,
+)
 from javamcp.server_factory import get_mcp_server
 
 
@@ -75,6 +88,8 @@ class TestFastMCPServer:
         state.repository_manager = None
         state.indexer = None
         state.query_engine = None
+        state.context_builder = None
+        state.parser = None
 
         initialize_server()
 
@@ -87,6 +102,8 @@ class TestFastMCPServer:
         assert isinstance(state.repository_manager, RepositoryManager)
         assert isinstance(state.indexer, APIIndexer)
         assert isinstance(state.query_engine, QueryEngine)
+        assert isinstance(state.context_builder, ContextBuilder)
+        assert state.parser is None
 
     @patch.object(RepositoryManager, "initialize_repositories")
     @patch("javamcp.server.load_config")
@@ -111,6 +128,33 @@ class TestFastMCPServer:
         mock_load_config.assert_called_once_with("/path/to/config.yml")
         assert get_state().initialized
 
+    def test_parser_created_on_first_use(self):
+        """Test the shared parser is created lazily and then reused."""
+        from javamcp.server import _get_parser
+
+        state = get_state()
+        saved = state.parser
+        state.parser = None
+        try:
+            parser = _get_parser()
+            assert isinstance(parser, JavaSourceParser)
+            assert _get_parser() is parser
+        finally:
+            state.parser = saved
+
+    def test_server_import_defers_parser(self):
+        """Test importing the server does not load the ANTLR parser."""
+        code = (
+            "import sys, javamcp.server; "
+            "sys.exit('javamcp.parser.java_parser' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+            check=False,
+        )
+        assert result.returncode == 0
+
     def test_get_state(self):
         """Test getting server state."""
         state = get_state()
@@ -120,6 +164,8 @@ class TestFastMCPServer:
         assert hasattr(state, "repository_manager")
         assert hasattr(state, "indexer")
         assert hasattr(state, "query_engine")
+        assert hasattr(state, "context_builder")
+        assert hasattr(state, "parser")
         assert hasattr(state, "initialized")
 
     def test_mcp_instance_exists(self):
@@ -200,3 +246,303 @@ class TestFastMCPResources:
         # Function is not decorated at module level anymore due to lazy initialization
         # Just verify it's callable
         assert callable(get_project_context)
+
+
+class TestDumpCache:
+    """Tests for the per-instance model_dump cache."""
+
+    def test_dump_cached_returns_model_dump(self):
+        """Test cached dump matches model_dump and is reused."""
+        java_class = JavaClass(
+            name="Cached",
+            fully_qualified_name="com.example.Cached",
+            package="com.example",
+        )
+
+        first = _dump_cached(java_class)
+        second = _dump_cached(java_class)
+
+        assert first == java_class.model_dump()
+        assert first is second
+
+    def test_dump_cached_evicted_on_collection(self):
+        """Test cache entry is removed once the model is garbage collected."""
+        java_class = JavaClass(
+            name="Transient",
+            fully_qualified_name="com.example.Transient",
+            package="com.example",
+        )
+        key = id(java_class)
+        _dump_cached(java_class)
+        assert key in _dump_cache
+
+        del java_class
+        gc.collect()
+
+        assert key not in _dump_cache
+
+
+class TestProjectContextResource:
+    """Tests for the project context resource serialization."""
+
+    CONTEXT = {
+        "repository_name": "repo",
+        "repository_url": "https://github.com/example/repo.git",
+        "description": "Example project",
+        "statistics": {"total_classes": 1},
+        "packages": [{"name": "com.example", "class_count": 1}],
+        "top_classes": [],
+        "javadoc_coverage": {"classes": 1.0},
+    }
+
+    @pytest.fixture
+    def initialized_state(self):
+        """Provide an initialized server state with a known repository."""
+        state = get_state()
+        saved = (
+            state.initialized,
+            state.repository_manager,
+            state.indexer,
+            state.project_context_cache,
+        )
+        state.repository_manager = MagicMock()
+        state.repository_manager.get_repository_by_name.return_value = MagicMock(
+            url="https://github.com/example/repo.git"
+        )
+        state.indexer = APIIndexer()
+        state.project_context_cache = {}
+        state.initialized = True
+        yield state
+        (
+            state.initialized,
+            state.repository_manager,
+            state.indexer,
+            state.project_context_cache,
+        ) = saved
+
+    def test_get_project_context_json(self, initialized_state):
+        """Test the project context is rendered as an indented JSON document."""
+        from javamcp.server import get_project_context
+
+        with patch(
+            "javamcp.server.ProjectContextBuilder.build_project_context",
+            return_value=self.CONTEXT,
+        ):
+            result = get_project_context("repo")
+
+        payload = json.loads(result)
+        assert payload["repository_name"] == "repo"
+        assert payload["packages"] == self.CONTEXT["packages"]
+        assert payload["readme_content"] is None
+        assert '\n  "repository_name": "repo"' in result
+
+    def test_get_project_context_cached_per_generation(self, initialized_state):
+        """Test context is rebuilt only after the index changes."""
+        from javamcp.server import get_project_context
+
+        with patch(
+            "javamcp.server.ProjectContextBuilder.build_project_context",
+            return_value=self.CONTEXT,
+        ) as mock_build:
+            first = get_project_context("repo")
+            second = get_project_context("repo")
+            assert mock_build.call_count == 1
+            assert second == first
+
+            initialized_state.indexer.add_class(
+                JavaClass(
+                    name="Other",
+                    fully_qualified_name="com.example.Other",
+                    package="com.example",
+                ),
+                "https://github.com/example/repo.git",
+            )
+            get_project_context("repo")
+            assert mock_build.call_count == 2
+
+
+@pytest.fixture
+def tool_state():
+    """Provide an initialized server state with fresh components."""
+    state = get_state()
+    saved = (
+        state.initialized,
+        state.repository_manager,
+        state.indexer,
+        state.query_engine,
+        state.context_builder,
+        state.parser,
+    )
+    state.repository_manager = MagicMock()
+    state.indexer = APIIndexer()
+    state.query_engine = QueryEngine(state.indexer)
+    state.context_builder = ContextBuilder()
+    state.parser = JavaSourceParser()
+    state.initialized = True
+    yield state
+    (
+        state.initialized,
+        state.repository_manager,
+        state.indexer,
+        state.query_engine,
+        state.context_builder,
+        state.parser,
+    ) = saved
+
+
+class TestSearchMethodsTool:
+    """Tests for the search_methods server tool."""
+
+    def test_search_methods_matches_validated_response(self, tool_state):
+        """Test the constructed response dumps like a validated one."""
+        from javamcp.models.mcp_protocol import (
+            SearchMethodsRequest,
+            SearchMethodsResponse,
+        )
+        from javamcp.server import search_methods
+
+        method = JavaMethod(name="readLine", return_type="String")
+        tool_state.indexer.add_class(
+            JavaClass(
+                name="Reader",
+                fully_qualified_name="com.example.Reader",
+                package="com.example",
+                methods=[method],
+            ),
+            "https://github.com/example/repo.git",
+        )
+
+        result = search_methods("readline")
+
+        expected = SearchMethodsResponse(
+            methods=[method],
+            total_found=1,
+            query=SearchMethodsRequest(method_name="readline"),
+        ).model_dump()
+        assert result == expected
+
+    def test_search_methods_returns_plain_dict(self, tool_state):
+        """Test the result is built from plain dicts and lists."""
+        from javamcp.server import search_methods
+
+        tool_state.indexer.add_class(
+            JavaClass(
+                name="Reader",
+                fully_qualified_name="com.example.Reader",
+                package="com.example",
+                methods=[JavaMethod(name="readLine", return_type="String")],
+            ),
+            "https://github.com/example/repo.git",
+        )
+
+        result = search_methods("readLine", class_name="Reader", case_sensitive=True)
+
+        assert set(result) == {"methods", "total_found", "query"}
+        assert result["query"] == {
+            "method_name": "readLine",
+            "class_name": "Reader",
+            "case_sensitive": True,
+        }
+        assert result["total_found"] == 1
+        assert type(result["methods"][0]) is dict
+        assert result["methods"][0]["name"] == "readLine"
+        json.dumps(result)
+
+
+@pytest.fixture(scope="module")
+def java_sources(tmp_path_factory):
+    """Write the sample Java sources once for the read-only extract_apis tests."""
+    source_dir = tmp_path_factory.mktemp("java_sources")
+    sources = {
+        "Greeter": (
+            "package com.example;\n"
+            "public class Greeter { public String greet() { return null; } }\n"
+        ),
+        "Broken": "this is not java",
+    }
+    for name in ("Alpha", "Beta", "Gamma"):
+        sources[name] = (
+            f"package com.example;\npublic class {name} {{ void run() {{}} }}\n"
+        )
+    paths = {}
+    for name, content in sources.items():
+        paths[name] = source_dir / f"{name}.java"
+        paths[name].write_text(content)
+    return paths
+
+
+class TestExtractApisTool:
+    """Tests for the extract_apis server tool."""
+
+    def test_extract_apis_returns_dumped_classes(self, tool_state, java_sources):
+        """Test extract_apis parses, indexes and serializes classes once."""
+        from javamcp.server import extract_apis
+
+        good = java_sources["Greeter"]
+        bad = java_sources["Broken"]
+
+        url = "https://github.com/example/repo.git"
+        mock_repo_manager = tool_state.repository_manager
+        mock_repo_manager.get_java_files_cached.return_value = (str(good), str(bad))
+        mock_repo_manager.get_repository_metadata.return_value = MagicMock(
+            branch="main"
+        )
+
+        result = extract_apis(url)
+
+        mock_repo_manager.ensure_repository.assert_called_once_with(url)
+
+        assert isinstance(result, dict)
+        assert result["total_classes"] == 1
+        assert result["total_methods"] == 1
+        assert result["branch"] == "main"
+        assert isinstance(result["classes"][0], dict)
+        assert result["classes"][0]["fully_qualified_name"] == "com.example.Greeter"
+        assert tool_state.indexer.get_class_by_fqn("com.example.Greeter")
+
+    @patch("javamcp.server._worker_parser", None)
+    def test_parse_one_reuses_worker_parser(self, java_sources):
+        """Test worker parsing builds one parser and reuses it per process."""
+        import javamcp.server as server_module
+
+        java_file = java_sources["Greeter"]
+
+        server_module._init_worker()
+        worker_parser = server_module._worker_parser
+
+        assert server_module._parse_one(str(java_file)).name == "Greeter"
+        assert server_module._parse_one(str(java_file), re.compile("x")) is None
+        assert server_module._worker_parser is worker_parser
+
+    @patch("javamcp.server._parse_pool", None)
+    @patch("javamcp.server.PARALLEL_PARSE_MIN_FILES", 1)
+    def test_extract_apis_parses_in_worker_processes(self, tool_state, java_sources):
+        """Test parallel parsing returns and indexes the same classes."""
+        import javamcp.server as server_module
+        from javamcp.server import extract_apis
+
+        files = [java_sources[name] for name in ("Alpha", "Beta", "Gamma")]
+
+        mock_repo_manager = tool_state.repository_manager
+        mock_repo_manager.get_java_files_cached.return_value = tuple(map(str, files))
+        mock_repo_manager.get_repository_metadata.return_value = None
+
+        pool = None
+        try:
+            result = extract_apis(
+                "https://github.com/example/repo.git", class_filter="ETA"
+            )
+            pool = server_module._parse_pool
+
+            assert [c["name"] for c in result["classes"]] == ["Beta"]
+            assert result["total_methods"] == 1
+            assert tool_state.indexer.get_class_by_fqn("com.example.Beta")
+            assert tool_state.indexer.get_class_by_fqn("com.example.Alpha") is None
+
+            # One spawn-started pool is shared by every call
+            extract_apis("https://github.com/example/repo.git")
+            assert server_module._parse_pool is pool
+            assert pool._mp_context.get_start_method() == "spawn"
+        finally:
+            if pool is not None:
+                pool.shutdown()
@@ -44,6 +44,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from javamcp.context.context_builder import ContextBuilder
+from javamcp.context.guide_builder import extract_keywords
 from javamcp.indexer.indexer import APIIndexer
 from javamcp.indexer.query_engine import QueryEngine
 from javamcp.models.java_entities import JavaClass, JavaDoc, JavaMethod, JavaParameter
@@ -227,6 +228,26 @@ class TestAnalyzeClassTool:
         with pytest.raises(RepositoryNotIndexedError):
             analyze_class_tool(request, query_engine_with_data)
 
+    def test_analyze_class_from_other_indexed_repository(self, query_engine_with_data):
+        """Test class is not found when filtered by another indexed repo."""
+        query_engine_with_data.indexer.add_class(
+            JavaClass(
+                name="OtherClass",
+                fully_qualified_name="org.other.OtherClass",
+                package="org.other",
+            ),
+            "other-repo",
+        )
+        request = AnalyzeClassRequest(
+            fully_qualified_name="com.example.TestClass",
+            repository_name="other-repo",
+        )
+
+        response = analyze_class_tool(request, query_engine_with_data)
+
+        assert response.found is False
+        assert response.matches == 0
+
 
 class TestGenerateGuideTool:
     """Tests for generate_guide_tool function."""
@@ -269,6 +290,18 @@ class TestGenerateGuideTool:
         assert len(response.relevant_classes) <= 1
         assert len(response.relevant_methods) <= 1
 
+    def test_generate_guide_deduplicates_results(self, query_engine_with_data):
+        """Test APIs matched by several keywords are only listed once."""
+        request = GenerateGuideRequest(
+            use_case="testclass testmethod test method class",
+            max_results=10,
+        )
+
+        response = generate_guide_tool(request, query_engine_with_data)
+
+        assert [c.name for c in response.relevant_classes] == ["TestClass"]
+        assert [m.name for m in response.relevant_methods] == ["testMethod"]
+
     def test_extract_keywords_basic(self):
         """Test keyword extraction."""
         use_case = "How to use String manipulation"
@@ -301,6 +334,29 @@ class TestGenerateGuideTool:
         assert "bb" not in keywords
         assert "ccc" in keywords
 
+    def test_extract_keywords_splits_punctuation(self):
+        """Test punctuation separates words but identifier characters do not."""
+        keywords = _extract_keywords("How-to read_file, then call api.send($data)!")
+
+        assert keywords == ["read_file", "then", "call", "api", "send", "$data"]
+
+    def test_extract_keywords_splits_generic_types(self):
+        """Test type parameters are split into separate keywords."""
+        keywords = _extract_keywords("Map<String,List<Integer>> to JSON")
+
+        assert keywords == ["map", "string", "list", "integer", "json"]
+
+    def test_extract_keywords_cached(self):
+        """Test repeated use cases are served from the keyword cache."""
+        extract_keywords.cache_clear()
+
+        first = _extract_keywords("parse json document")
+        first.append("mutated")
+        second = _extract_keywords("parse json document")
+
+        assert second == ["parse", "json", "document"]
+        assert extract_keywords.cache_info().hits == 1
+
     def test_generate_guide_empty_use_case(self, query_engine_with_data):
         """Test guide generation with empty use case."""
         request = GenerateGuideRequest(
@@ -311,7 +367,35 @@ class TestGenerateGuideTool:
         response = generate_guide_tool(request, query_engine_with_data)
 
         assert response.use_case == ""
-        assert response.guide is not None
+        assert response.guide == "# API Usage Guide: \n"
+        assert response.relevant_classes == []
+        assert response.relevant_methods == []
+
+    def test_generate_guide_spreads_results_across_keywords(self):
+        """Test each keyword contributes at most its share of max_results."""
+        methods = [
+            JavaMethod(name=f"readValue{i}", return_type="void") for i in range(4)
+        ] + [JavaMethod(name=f"writeValue{i}", return_type="void") for i in range(4)]
+        indexer = APIIndexer()
+        indexer.add_class(
+            JavaClass(
+                name="Codec",
+                fully_qualified_name="com.example.Codec",
+                package="com.example",
+                methods=methods,
+            ),
+            "test-repo",
+        )
+        request = GenerateGuideRequest(use_case="read write", max_results=4)
+
+        response = generate_guide_tool(request, QueryEngine(indexer))
+
+        assert [m.name for m in response.relevant_methods] == [
+            "readValue0",
+            "readValue1",
+            "writeValue0",
+            "writeValue1",
+        ]
 
 
 class TestExtractApisTool:
@@ -324,7 +408,7 @@ class TestExtractApisTool:
         # Setup mocks
         mock_repo_manager = MagicMock()
         mock_repo_manager_class.return_value = mock_repo_manager
-        mock_repo_manager.get_java_files.return_value = []
+        mock_repo_manager.iter_java_files.return_value = []
 
         indexer = APIIndexer()
         request = ExtractApisRequest(
@@ -353,7 +437,7 @@ class TestExtractApisTool:
 
         java_file = tmp_path / "Test.java"
         java_file.write_text("public class Test {}")
-        mock_repo_manager.get_java_files.return_value = [java_file]
+        mock_repo_manager.iter_java_files.return_value = [java_file]
 
         mock_parser = MagicMock()
         mock_parser_class.return_value = mock_parser
@@ -382,7 +466,7 @@ class TestExtractApisTool:
         # Setup mocks
         mock_repo_manager = MagicMock()
         mock_repo_manager_class.return_value = mock_repo_manager
-        mock_repo_manager.filter_java_files_by_package.return_value = []
+        mock_repo_manager.iter_java_files_by_package.return_value = []
 
         indexer = APIIndexer()
         request = ExtractApisRequest(
@@ -395,7 +479,7 @@ class TestExtractApisTool:
 
         response = extract_apis_tool(request, indexer)
 
-        mock_repo_manager.filter_java_files_by_package.assert_called_once_with(
+        mock_repo_manager.iter_java_files_by_package.assert_called_once_with(
             request.repository_url, request.package_filter
         )
 
@@ -411,7 +495,7 @@ class TestExtractApisTool:
 
         java_file = tmp_path / "Test.java"
         java_file.write_text("public class Test {}")
-        mock_repo_manager.get_java_files.return_value = [java_file]
+        mock_repo_manager.iter_java_files.return_value = [java_file]
 
         mock_parser = MagicMock()
         mock_parser_class.return_value = mock_parser
@@ -438,6 +522,42 @@ class TestExtractApisTool:
         # Class should be filtered out
         assert response.total_classes == 0
 
+    @patch("javamcp.tools.extract_apis.RepositoryManager")
+    @patch("javamcp.tools.extract_apis.JavaSourceParser")
+    def test_extract_apis_class_filter_is_literal_and_case_insensitive(
+        self, mock_parser_class, mock_repo_manager_class, tmp_path
+    ):
+        """Test class filter matches literally, ignoring case."""
+        mock_repo_manager = mock_repo_manager_class.return_value
+        mock_repo_manager.iter_java_files.return_value = [
+            tmp_path / "A.java",
+            tmp_path / "B.java",
+        ]
+        mock_parser_class.return_value.parse_file.side_effect = [
+            JavaClass(
+                name="Outer$Inner",
+                fully_qualified_name="com.example.Outer$Inner",
+                package="com.example",
+            ),
+            JavaClass(
+                name="OuterInner",
+                fully_qualified_name="com.example.OuterInner",
+                package="com.example",
+            ),
+        ]
+
+        request = ExtractApisRequest(
+            repository_url="https://github.com/example/repo.git",
+            branch="main",
+            class_filter="OUTER$",
+        )
+
+        from javamcp.tools.extract_apis import extract_apis_tool
+
+        response = extract_apis_tool(request, APIIndexer())
+
+        assert [c.name for c in response.classes] == ["Outer$Inner"]
+
     @patch("javamcp.tools.extract_apis.RepositoryManager")
     @patch("javamcp.tools.extract_apis.JavaSourceParser")
     def test_extract_apis_handles_parse_errors(
@@ -450,7 +570,7 @@ class TestExtractApisTool:
 
         java_file = tmp_path / "Test.java"
         java_file.write_text("invalid java")
-        mock_repo_manager.get_java_files.return_value = [java_file]
+        mock_repo_manager.iter_java_files.return_value = [java_file]
 
         mock_parser = MagicMock()
         mock_parser_class.return_value = mock_parser
@@ -0,0 +1,233 @@
+# General Disclaimer
+#
+# **AI Generated Content**
+#
+# This project's source code and documentation were generated predominantly
+# by an Artificial Intelligence Large Language Model (AI LLM). The project
+# lead, [Rubens Gomes](https://rubensgomes.com), provided initial prompts,
+# reviewed, and made refinements to the generated output. While human review and
+# refinement have occurred, users should be aware that the output may contain
+# inaccuracies, errors, or security vulnerabilities
+#
+# **Third-Party Content Notice**
+#
+# This software may include components or snippets derived from third-party
+# sources. The software's users and distributors are responsible for ensuring
+# compliance with any underlying licenses applicable to such components.
+#
+# **Copyright Status Statement**
+#
+# Copyright protection, if any, is limited to the original human contributions and
+# modifications made to this project. The AI-generated portions of the code and
+# documentation are not subject to copyright and are considered to be in the
+# public domain.
+#
+# **Limitation of liability**
+#
+# IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES, OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT, OR
+# OTHERWISE, ARISING FROM, OUT OF, OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+# OR OTHER DEALINGS IN THE SOFTWARE.
+#
+# **No-Warranty Disclaimer**
+#
+# THIS SOFTWARE IS PROVIDED 'AS IS,' WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE, AND NONINFRINGEMENT.
+
+"""
+Unit tests for utility helper functions.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from javamcp.utils.helpers import (
+    extract_repository_name,
+    format_class_name,
+    format_list,
+    format_method_signature,
+    get_package_name,
+    is_java_file,
+    normalize_path,
+    validate_branch_name,
+    validate_java_file,
+    validate_repository_url,
+)
+
+
+class TestValidateRepositoryUrl:
+    """Tests for validate_repository_url."""
+
+    def test_ssh_url(self):
+        """Test SSH repository URLs."""
+        assert validate_repository_url("git@github.com:user/repo.git")
+        assert validate_repository_url("git@git.example.com:my-org/my_repo.git")
+        assert not validate_repository_url("git@github.com:user/repo")
+        assert not validate_repository_url("git@github.com:user/nested/repo.git")
+
+    def test_https_url(self):
+        """Test HTTP(S) repository URLs."""
+        assert validate_repository_url("https://github.com/user/repo.git")
+        assert validate_repository_url("http://github.com/user/repo")
+        assert not validate_repository_url("ftp://github.com/user/repo.git")
+        assert not validate_repository_url("https://github.com")
+        assert validate_repository_url("HTTPS://github.com/user/repo.git")
+
+    def test_url_with_query_or_fragment(self):
+        """Test URLs that need full URL parsing."""
+        assert validate_repository_url("https://github.com/user/repo.git#readme")
+        assert not validate_repository_url("https://github.com?tab=repos")
+        assert not validate_repository_url("https://[github.com/user/repo.git")
+        assert not validate_repository_url("https://github.com]/user/repo.git")
+        assert validate_repository_url(" https://github.com/user/repo.git")
+        assert not validate_repository_url("not a url")
+
+
+class TestExtractRepositoryName:
+    """Tests for extract_repository_name."""
+
+    def test_ssh_url(self):
+        """Test name extraction from SSH URLs."""
+        assert extract_repository_name("git@github.com:user/repo.git") == "repo"
+        assert extract_repository_name("git@github.com:user/repo") is None
+
+    def test_https_url(self):
+        """Test name extraction from HTTP(S) URLs."""
+        assert extract_repository_name("https://github.com/user/repo.git") == "repo"
+        assert extract_repository_name("https://github.com/user/repo/") == "repo"
+        assert extract_repository_name("https://github.com/user/repo") == "repo"
+        assert extract_repository_name("https://github.com/") is None
+        assert extract_repository_name("https://github.com/user/repo.git?x=1") == (
+            "repo"
+        )
+
+
+class TestValidateBranchName:
+    """Tests for validate_branch_name."""
+
+    def test_valid_branch_names(self):
+        """Test ordinary branch names are accepted."""
+        for branch in ("main", "feature/new-api", "release-1.2", "v1.0_rc"):
+            assert validate_branch_name(branch), branch
+
+    def test_invalid_characters(self):
+        """Test branch names with forbidden sequences are rejected."""
+        for branch in ("a..b", "a~1", "a^", "a:b", "a?", "a*", "a[0]", "a\\b"):
+            assert not validate_branch_name(branch), branch
+
+    def test_invalid_edges_and_values(self):
+        """Test leading/trailing separators and non-string values."""
+        for branch in ("/main", "main/", ".main", "main.", " main", "main ", ""):
+            assert not validate_branch_name(branch), branch
+        assert not validate_branch_name(None)
+
+
+class TestNormalizePath:
+    """Tests for normalize_path."""
+
+    def test_normalize_path_relative_follows_cwd(self, tmp_path, monkeypatch):
+        """Test relative paths resolve against the current directory."""
+        (tmp_path / "first").mkdir()
+        (tmp_path / "second").mkdir()
+
+        monkeypatch.chdir(tmp_path / "first")
+        assert normalize_path("repo") == (tmp_path / "first" / "repo").resolve()
+
+        monkeypatch.chdir(tmp_path / "second")
+        assert normalize_path("repo") == (tmp_path / "second" / "repo").resolve()
+
+
+class TestClassNameHelpers:
+    """Tests for format_class_name and get_package_name."""
+
+    def test_qualified_name(self):
+        """Test splitting a fully-qualified class name."""
+        assert format_class_name("com.example.service.UserService") == "UserService"
+        assert get_package_name("com.example.service.UserService") == (
+            "com.example.service"
+        )
+
+    def test_default_package(self):
+        """Test class names without a package."""
+        assert format_class_name("UserService") == "UserService"
+        assert get_package_name("UserService") == ""
+
+    def test_names_are_interned(self):
+        """Test repeated names are returned as the same string object."""
+        first = "".join(["com.example.", "UserService"])
+        second = "".join(["com.example.", "UserService"])
+
+        assert format_class_name(first) is format_class_name(second)
+        assert get_package_name(first) is get_package_name(second)
+
+
+class TestFormatMethodSignature:
+    """Tests for format_method_signature."""
+
+    def test_with_parameters(self):
+        """Test parameters are listed as type and name pairs."""
+        signature = format_method_signature(
+            "put", [("String", "key"), ("List<Integer>", "values")], "void"
+        )
+
+        assert signature == "void put(String key, List<Integer> values)"
+
+    def test_without_parameters(self):
+        """Test a method without parameters."""
+        assert format_method_signature("size", [], "int") == "int size()"
+
+
+class TestIsJavaFile:
+    """Tests for is_java_file."""
+
+    def test_java_paths(self):
+        """Test Java source files given as paths or names."""
+        assert is_java_file(Path("src/com/example/Main.java"))
+        assert is_java_file(Path("Legacy.JAVA"))
+        assert is_java_file("Main.java")
+
+    def test_other_paths(self):
+        """Test non-Java files and bare suffixes are rejected."""
+        assert not is_java_file(Path("Main.class"))
+        assert not is_java_file(Path("README.md"))
+        assert not is_java_file(Path(".java"))
+        assert not is_java_file("javadoc")
+
+
+class TestValidateJavaFile:
+    """Tests for validate_java_file."""
+
+    def test_existing_java_file(self, tmp_path):
+        """Test an existing Java file is valid."""
+        java_file = tmp_path / "Main.java"
+        java_file.write_text("class Main {}")
+
+        assert validate_java_file(java_file)
+
+    def test_missing_or_directory(self, tmp_path):
+        """Test missing files and directories named like Java files."""
+        (tmp_path / "pkg.java").mkdir()
+
+        assert not validate_java_file(tmp_path / "Missing.java")
+        assert not validate_java_file(tmp_path / "pkg.java")
+
+    def test_non_java_file_skips_filesystem(self):
+        """Test non-Java names are rejected without a stat call."""
+        with patch.object(Path, "is_file") as mock_is_file:
+            assert not validate_java_file(Path("README.md"))
+            mock_is_file.assert_not_called()
+
+
+class TestFormatList:
+    """Tests for format_list."""
+
+    def test_empty_and_short_lists(self):
+        """Test lists within the display limit are joined in full."""
+        assert format_list([]) == "none"
+        assert format_list(["a", "b"]) == "a, b"
+        assert format_list(["a", "b"], max_items=2) == "a, b"
+
+    def test_truncated_list(self):
+        """Test long lists report how many items were left out."""
+        assert format_list(["a", "b", "c", "d"], max_items=2) == "a, b (and 2 more)"